@@ -0,0 +1,5 @@
+from .base import ApiError, BatchError
+from .sync_client import LGGClient
+from .async_client import AsyncLGGClient
+
+__all__ = ["LGGClient", "AsyncLGGClient", "ApiError", "BatchError"]
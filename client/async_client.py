@@ -0,0 +1,127 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+
+from client.base import ClientBase, parse_openapi, parse_sse, to_operation_id
+
+
+class AsyncLGGClient(ClientBase):
+    """
+    Asyncio client for the Lakeshore Management API, with the same calls as LGGClient.
+
+    Operation methods resolved by name (``await client.get_monitor(channel=1)``) need the
+    OpenAPI document, so call ``await client.connect()`` (or use ``async with``) first.
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8000", uds: str | None = None,
+                 http2: bool = False, **kwargs: Any) -> None:
+        super().__init__(base_url, uds, **kwargs)
+        self._http = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=uds, http1=not http2, http2=http2) if uds else None,
+            http1=not http2,
+            http2=http2,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+
+    async def __aenter__(self) -> "AsyncLGGClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        if self._operations is None:
+            response = await self._http.get(self._url("/openapi.json"))
+            response.raise_for_status()
+            self._operations = parse_openapi(response.json())
+
+    async def close(self) -> None:
+        await self._http.aclose()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._operations is None:
+            raise AttributeError(f"{name}: call 'await client.connect()' before using operation methods")
+        operation_id = to_operation_id(name)
+        self._operation(operation_id)
+        return lambda **kwargs: self.call(operation_id, **kwargs)
+
+    async def supports(self, operation_id: str) -> bool:
+        await self.connect()
+        assert self._operations is not None
+        return operation_id in self._operations
+
+    async def call(self, operation_id: str, **kwargs: Any) -> Any:
+        """
+        Call an operation by operation_id. See LGGClient.call.
+
+        :param self: AsyncLGGClient instance
+        :param operation_id: operation_id of the endpoint, e.g. getMonitor
+        :type operation_id: str
+        :return: Decoded JSON response
+        :rtype: Any
+        """
+        await self.connect()
+        request = self._build(self._operation(operation_id), kwargs)
+        attempt = 0
+        while True:
+            response = await self._http.send(self._prepare(request))
+            delay = self._retry_after(response, attempt)
+            if delay is None:
+                return self._result(request, response)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """
+        Run several operations back to back. See LGGClient.batch.
+
+        :param self: AsyncLGGClient instance
+        :param calls: (operation_id, keyword arguments) pairs
+        :type calls: list[tuple[str, dict[str, Any]]]
+        :return: Result of each call, in order
+        :rtype: list[Any]
+        """
+        if not await self.supports("runBatch"):
+            return [await self.call(operation_id, **kwargs) for operation_id, kwargs in calls]
+        return self._batch_results(await self.call("runBatch", body=self._batch_body(calls)))
+
+    async def stream_readings(self, units: list[str] | None = None, channels: list[int] | None = None,
+                              interval: float = 1.0) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Yield ``(topic, event)`` pairs of sampled readings. See LGGClient.stream_readings.
+
+        :param self: AsyncLGGClient instance
+        :param units: Units to include, e.g. ["K", "C"]
+        :type units: list[str] | None
+        :param channels: Channels to poll when falling back to polling (default all)
+        :type channels: list[int] | None
+        :param interval: Polling interval in seconds when falling back to polling
+        :type interval: float
+        :return: Async iterator of (topic, event) pairs
+        :rtype: AsyncIterator[tuple[str, dict[str, Any]]]
+        """
+        params = {"units": ",".join(units)} if units else {}
+        if await self.supports("streamReadings"):
+            request = self._build(self._operation("streamReadings"), params)
+            async with self._http.stream("GET", request.url, headers=request.headers, timeout=None) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._result(request, response)
+                event: dict[str, str] = {}
+                async for line in response.aiter_lines():
+                    parsed = parse_sse([line], event)
+                    if parsed is not None:
+                        yield parsed
+            return
+        while True:
+            for channel in channels or range(1, 9):
+                reading = await self.call("getMonitor", channel=channel, **params)
+                yield "reading", {"channel": channel, "timestamp": time.time(), **reading}
+            await asyncio.sleep(interval)
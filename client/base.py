@@ -0,0 +1,223 @@
+import json
+import re
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+# Header a client sends to identify itself for per-client rate limits
+API_KEY_HEADER = "X-API-Key"
+
+# Header bounding how long the server may wait on the device for a request
+TIMEOUT_HEADER = "X-Request-Timeout"
+
+
+class ApiError(Exception):
+    """Raised when the server answers a call with an error status."""
+
+    def __init__(self, status_code: int, detail: Any) -> None:
+        super().__init__(f"{status_code}: {detail}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+class BatchError(Exception):
+    """Raised when an operation of a batch fails. Holds the results of every operation."""
+
+    def __init__(self, results: list[dict[str, Any]]) -> None:
+        failed = next(r for r in results if not r["isSuccess"])
+        super().__init__(f"{failed['operationId']} failed: {failed['error']}")
+        self.results = results
+
+
+@dataclass(frozen=True)
+class Operation:
+    """An API operation as advertised in the server's OpenAPI document."""
+
+    operation_id: str
+    method: str
+    path: str
+    path_params: tuple[str, ...]
+    query_params: tuple[str, ...]
+    has_body: bool
+
+
+def parse_openapi(spec: dict[str, Any]) -> dict[str, Operation]:
+    """
+    Index the operations of an OpenAPI document by operation_id.
+
+    :param spec: OpenAPI document
+    :type spec: dict[str, Any]
+    :return: Operations keyed by operation_id
+    :rtype: dict[str, Operation]
+    """
+    operations = {}
+    for path, methods in spec.get("paths", {}).items():
+        for method, op in methods.items():
+            if "operationId" not in op:
+                continue
+            params = op.get("parameters", [])
+            operations[op["operationId"]] = Operation(
+                operation_id=op["operationId"],
+                method=method.upper(),
+                path=path,
+                path_params=tuple(p["name"] for p in params if p["in"] == "path"),
+                query_params=tuple(p["name"] for p in params if p["in"] == "query"),
+                has_body="requestBody" in op,
+            )
+    return operations
+
+
+def to_operation_id(name: str) -> str:
+    """Map a snake_case method name to its camelCase operation_id (get_monitor -> getMonitor)."""
+    first, *rest = name.split("_")
+    return first + "".join(part.title() for part in rest)
+
+
+def parse_sse(lines: Iterable[str], event: dict[str, str]) -> tuple[str, Any] | None:
+    """
+    Feed Server-Sent Events lines into a pending event; return it once complete.
+
+    :param lines: Lines received so far (one at a time is fine)
+    :type lines: Iterable[str]
+    :param event: Mutable pending event state, shared between calls
+    :type event: dict[str, str]
+    :return: (topic, decoded data) when a blank line ends an event, else None
+    :rtype: tuple[str, Any] | None
+    """
+    for line in lines:
+        if not line:
+            if "data" in event:
+                topic, data = event.pop("event", "message"), event.pop("data")
+                return topic, json.loads(data)
+            event.clear()
+        elif not line.startswith(":"):
+            field, _, value = line.partition(":")
+            event[field] = value.removeprefix(" ")
+    return None
+
+
+class ETagCache:
+    """Bounded LRU cache of GET response bodies keyed by URL, revalidated with ETags."""
+
+    def __init__(self, size: int = 256) -> None:
+        self.size = size
+        self._entries: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+
+    def etag(self, url: str) -> str | None:
+        entry = self._entries.get(url)
+        return entry[0] if entry else None
+
+    def get(self, url: str) -> Any:
+        self._entries.move_to_end(url)
+        return self._entries[url][1]
+
+    def put(self, url: str, etag: str, body: Any) -> None:
+        self._entries[url] = (etag, body)
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+
+class ClientBase:
+    """
+    Request building and response handling shared by the sync and async clients.
+
+    Operations are looked up by operation_id in the server's OpenAPI document, so every
+    endpoint in ``routers/v1`` is callable as ``client.call("getMonitor", channel=1)`` or
+    ``client.get_monitor(channel=1)`` without client changes when routes are added.
+    """
+
+    _operations: dict[str, Operation] | None
+
+    def __init__(self, base_url: str = "http://localhost:8000", uds: str | None = None,
+                 api_key: str | None = None, timeout: float = 30.0, cache_size: int = 256,
+                 max_retries: int = 2) -> None:
+        self.base_url = base_url
+        self.uds = uds
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.headers = {API_KEY_HEADER: api_key} if api_key else {}
+        self.cache = ETagCache(cache_size)
+        self._operations = None
+
+    def _url(self, path: str) -> httpx.URL:
+        # Join relative to base_url so a path prefix (e.g. behind a reverse proxy) is kept
+        return httpx.URL(self.base_url.rstrip("/") + "/").join(path.lstrip("/"))
+
+    def _build(self, operation: Operation, kwargs: dict[str, Any]) -> httpx.Request:
+        kwargs = dict(kwargs)
+        body = kwargs.pop("body", None)
+        request_timeout = kwargs.pop("request_timeout", None)
+        try:
+            path = re.sub(r"{(\w+)}", lambda m: str(kwargs.pop(m.group(1))), operation.path)
+        except KeyError as e:
+            raise TypeError(f"{operation.operation_id} requires argument {e}") from None
+        unknown = set(kwargs) - set(operation.query_params)
+        if unknown:
+            raise TypeError(f"{operation.operation_id} got unexpected arguments: {', '.join(sorted(unknown))}")
+        headers = dict(self.headers)
+        if request_timeout is not None:
+            headers[TIMEOUT_HEADER] = str(request_timeout)
+        params = {k: v for k, v in kwargs.items() if v is not None}
+        return httpx.Request(
+            operation.method, self._url(path), params=params, headers=headers,
+            json=body if operation.has_body else None)
+
+    def _prepare(self, request: httpx.Request) -> httpx.Request:
+        if request.method == "GET":
+            etag = self.cache.etag(str(request.url))
+            if etag:
+                request.headers["If-None-Match"] = etag
+        return request
+
+    def _result(self, request: httpx.Request, response: httpx.Response) -> Any:
+        url = str(request.url)
+        if response.status_code == 304:
+            return self.cache.get(url)
+        if response.status_code >= 400:
+            try:
+                detail = response.json()
+                detail = detail.get("detail", detail.get("message", detail))
+            except ValueError:
+                detail = response.text
+            raise ApiError(response.status_code, detail)
+        if not response.content:
+            return None
+        body = response.json()
+        if request.method == "GET" and "etag" in response.headers:
+            self.cache.put(url, response.headers["etag"], body)
+        return body
+
+    def _retry_after(self, response: httpx.Response, attempt: int) -> float | None:
+        if response.status_code != 429 or attempt >= self.max_retries:
+            return None
+        try:
+            return float(response.headers.get("retry-after", "1"))
+        except ValueError:
+            return 1.0
+
+    def _operation(self, operation_id: str) -> Operation:
+        assert self._operations is not None
+        try:
+            return self._operations[operation_id]
+        except KeyError:
+            raise AttributeError(f"Server does not advertise operation '{operation_id}'") from None
+
+    @staticmethod
+    def _batch_body(calls: list[tuple[str, dict[str, Any]]]) -> dict[str, Any]:
+        operations = []
+        for operation_id, kwargs in calls:
+            kwargs = dict(kwargs)
+            body = kwargs.pop("body", None)
+            operations.append({"operationId": operation_id, "params": kwargs, "body": body})
+        return {"operations": operations}
+
+    @staticmethod
+    def _batch_results(response: dict[str, Any]) -> list[Any]:
+        results = response["results"]
+        if response["completed"] < len(results):
+            raise BatchError(results)
+        return [r["result"] for r in results]
@@ -0,0 +1,133 @@
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+
+from client.base import ClientBase, parse_openapi, parse_sse, to_operation_id
+
+
+class LGGClient(ClientBase):
+    """
+    Synchronous client for the Lakeshore Management API.
+
+    One pooled keep-alive connection set is reused for every call; pass ``uds`` to talk
+    to the server over a Unix domain socket, and ``http2=True`` (needs the ``http2`` extra) to
+    multiplex concurrent calls over one HTTP/2 connection to a server started with HTTP2.
+    Use as a context manager, or call close().
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8000", uds: str | None = None,
+                 http2: bool = False, **kwargs: Any) -> None:
+        super().__init__(base_url, uds, **kwargs)
+        self._http = httpx.Client(
+            transport=httpx.HTTPTransport(uds=uds, http1=not http2, http2=http2) if uds else None,
+            http1=not http2,
+            http2=http2,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+
+    def __enter__(self) -> "LGGClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._http.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        operation_id = to_operation_id(name)
+        self._load_operations()
+        self._operation(operation_id)
+        return lambda **kwargs: self.call(operation_id, **kwargs)
+
+    def _load_operations(self) -> None:
+        if self._operations is None:
+            response = self._http.get(self._url("/openapi.json"))
+            response.raise_for_status()
+            self._operations = parse_openapi(response.json())
+
+    def supports(self, operation_id: str) -> bool:
+        self._load_operations()
+        assert self._operations is not None
+        return operation_id in self._operations
+
+    def call(self, operation_id: str, **kwargs: Any) -> Any:
+        """
+        Call an operation by operation_id.
+
+        Path and query parameters are passed as keyword arguments, the request body as
+        ``body`` and a per-call device deadline (seconds) as ``request_timeout``.
+        Rate-limited calls (429) are retried after the server's Retry-After delay.
+
+        :param self: LGGClient instance
+        :param operation_id: operation_id of the endpoint, e.g. getMonitor
+        :type operation_id: str
+        :return: Decoded JSON response
+        :rtype: Any
+        """
+        self._load_operations()
+        request = self._build(self._operation(operation_id), kwargs)
+        attempt = 0
+        while True:
+            response = self._http.send(self._prepare(request))
+            delay = self._retry_after(response, attempt)
+            if delay is None:
+                return self._result(request, response)
+            attempt += 1
+            time.sleep(delay)
+
+    def batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """
+        Run several operations back to back, in one request if the server supports batches.
+
+        :param self: LGGClient instance
+        :param calls: (operation_id, keyword arguments) pairs
+        :type calls: list[tuple[str, dict[str, Any]]]
+        :return: Result of each call, in order
+        :rtype: list[Any]
+        """
+        if not self.supports("runBatch"):
+            return [self.call(operation_id, **kwargs) for operation_id, kwargs in calls]
+        return self._batch_results(self.call("runBatch", body=self._batch_body(calls)))
+
+    def stream_readings(self, units: list[str] | None = None, channels: list[int] | None = None,
+                        interval: float = 1.0) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Yield ``(topic, event)`` pairs of sampled readings as they arrive.
+
+        Uses the server's event stream when advertised; otherwise polls getMonitor for
+        each channel every ``interval`` seconds and yields ``reading`` events.
+
+        :param self: LGGClient instance
+        :param units: Units to include, e.g. ["K", "C"]
+        :type units: list[str] | None
+        :param channels: Channels to poll when falling back to polling (default all)
+        :type channels: list[int] | None
+        :param interval: Polling interval in seconds when falling back to polling
+        :type interval: float
+        :return: Iterator of (topic, event) pairs
+        :rtype: Iterator[tuple[str, dict[str, Any]]]
+        """
+        params = {"units": ",".join(units)} if units else {}
+        if self.supports("streamReadings"):
+            request = self._build(self._operation("streamReadings"), params)
+            with self._http.stream("GET", request.url, headers=request.headers, timeout=None) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    self._result(request, response)
+                event: dict[str, str] = {}
+                for line in response.iter_lines():
+                    parsed = parse_sse([line], event)
+                    if parsed is not None:
+                        yield parsed
+            return
+        while True:
+            for channel in channels or range(1, 9):
+                reading = self.call("getMonitor", channel=channel, **params)
+                yield "reading", {"channel": channel, "timestamp": time.time(), **reading}
+            time.sleep(interval)
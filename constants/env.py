@@ -1 +1,17 @@
 USE_MOCK = "USE_MOCK"
+SAMPLE_INTERVAL = "SAMPLE_INTERVAL"
+ALARM_WEBHOOK_URL = "ALARM_WEBHOOK_URL"
+DEVICE_COMMAND_BUDGET = "DEVICE_COMMAND_BUDGET"
+CURVE_LIBRARY_DIR = "CURVE_LIBRARY_DIR"
+HISTORY_CAPACITY = "HISTORY_CAPACITY"
+ADMISSION_RATE = "ADMISSION_RATE"
+ADMISSION_BURST = "ADMISSION_BURST"
+ADMISSION_MAX_QUEUE = "ADMISSION_MAX_QUEUE"
+ADMIN_TOKEN = "ADMIN_TOKEN"
+UDS_PATH = "UDS_PATH"
+HTTP2 = "HTTP2"
+AUDIT_PATH = "AUDIT_PATH"
+AUDIT_FSYNC = "AUDIT_FSYNC"
+AUDIT_MAX_BYTES = "AUDIT_MAX_BYTES"
+AUDIT_BACKUPS = "AUDIT_BACKUPS"
+API_KEYS = "API_KEYS"
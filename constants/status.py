@@ -0,0 +1,8 @@
+# Bit weights of the Model240 RDGST? response, keyed by StatusResp field name
+STATUS_BITS = {
+    "invalid_reading": 1,
+    "temp_under_range": 16,
+    "temp_over_range": 32,
+    "sensor_units_over_range": 64,
+    "sensor_units_under_range": 128,
+}
@@ -0,0 +1,20 @@
+# Header a client can send to bound how long (in seconds) a request may wait on the device
+TIMEOUT_HEADER = "X-Request-Timeout"
+
+# Upper bound accepted from the header, so a client cannot hold a worker forever
+MAX_TIMEOUT = 120.0
+
+# Default deadline for single-command device operations
+DEFAULT_TIMEOUT = 5.0
+
+# Default deadline for operations that walk all 200 curve points
+CURVE_TIMEOUT = 30.0
+
+# Default deadline for exporting or applying a full device configuration
+CONFIG_TIMEOUT = 120.0
+
+# Default deadline for a batch of operations run under one lock hold
+BATCH_TIMEOUT = 60.0
+
+# Default deadline for a burst of back-to-back monitor readings
+BURST_TIMEOUT = 30.0
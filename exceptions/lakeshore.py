@@ -27,3 +27,11 @@ class ChannelError(LakeshoreError):
     def __init__(self, channel: int, message: str = "Channel must be between 1 and 8") -> None:
         super().__init__(f"{message}. Provided channel: {channel}")
         self.channel = channel
+
+
+class DeadlineExceededError(LakeshoreError):
+    """Raised when a request's deadline passes before the device operation completes."""
+
+    def __init__(self, stage: str, message: str = "Request deadline exceeded") -> None:
+        super().__init__(f"{message} while waiting for {stage}")
+        self.stage = stage
@@ -1,10 +1,21 @@
+import asyncio
+import hashlib
+import os
+import socket
+import stat
+import time
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from routers import router_v1
 from services.lakeshore import LakeshoreService as ls
-from exceptions.lakeshore import LakeshoreError
+from exceptions.lakeshore import LakeshoreError, DeadlineExceededError
+from services.metrics import metrics
+from services.profiling import tracer
+from constants.env import UDS_PATH, HTTP2
+from schemas.operations import OperationResult
 
 app = FastAPI(
     title="Lakeshore Management API",
@@ -22,7 +33,83 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def stamp_received_at(request: Request, call_next):
+    # Deadlines are measured from arrival, so threadpool queueing counts against them
+    request.state.received_at = time.monotonic()
+    return await call_next(request)
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """
+    Whether an If-None-Match header lists an ETag, using the weak comparison it calls for.
+
+    :param etag: Strong ETag of the response, quoted
+    :type etag: str
+    :param if_none_match: Header value: ``*`` or a comma-separated list of (possibly W/) tags
+    :type if_none_match: str
+    :return: True if the client's copy is current
+    :rtype: bool
+    """
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+# Slowly changing GET resources worth revalidating; readings change on every request
+ETAG_PATHS = ("/api/v1/curve/", "/api/v1/curve-library", "/api/v1/device/config",
+              "/api/v1/device/identification", "/api/v1/reading/input/")
+
+# Headers describing the body, which a 304 has none of
+_CONTENT_HEADERS = {b"content-length", b"content-type", b"content-encoding"}
+
+
+@app.middleware("http")
+async def conditional_get(request: Request, call_next):
+    # Tag JSON GET responses so clients can revalidate cached bodies with If-None-Match
+    if request.method != "GET" or not request.url.path.startswith(ETAG_PATHS):
+        return await call_next(request)
+    response = await call_next(request)
+    if (response.status_code != 200
+            or not response.headers.get("content-type", "").startswith("application/json")):
+        return response
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if etag_matches(etag, request.headers.get("if-none-match", "")):
+        not_modified = Response(status_code=304)
+        not_modified.raw_headers = [
+            (name, value) for name, value in response.headers.raw if name not in _CONTENT_HEADERS
+        ] + [(b"etag", etag.encode())]
+        return not_modified
+    tagged = Response(body, status_code=200)
+    tagged.raw_headers = response.headers.raw + [(b"etag", etag.encode())]
+    return tagged
+
+
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    # Record the span timeline of each request while tracing is enabled (/api/v1/admin/tracing)
+    token = tracer.begin(time.monotonic())
+    if token is None:
+        return await call_next(request)
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        tracer.finish(token, request.method, request.url.path, status_code)
+
+
 # Custom Exception Handling
+@app.exception_handler(DeadlineExceededError)
+async def deadline_exception_handler(request: Request, exc: DeadlineExceededError) -> JSONResponse:
+    metrics.increment("deadline_expired_total", stage=exc.stage)
+    return JSONResponse(
+        status_code=504,
+        content={"message": str(exc)},
+    )
+
+
 @app.exception_handler(LakeshoreError)
 async def lakeshore_exception_handler(request: Request, exc: LakeshoreError) -> JSONResponse:
     return JSONResponse(
@@ -33,7 +120,76 @@ async def lakeshore_exception_handler(request: Request, exc: LakeshoreError) ->
 
 app.include_router(router_v1)
 
-if __name__ == "__main__":
+
+@app.get("/ready", operation_id="ready", response_model=OperationResult)
+def ready() -> JSONResponse:
+    """Readiness probe: connected to the device and startup prefill complete"""
+    service = ls()
+    if service.is_ready():
+        return JSONResponse(OperationResult(is_success=True, message="Ready").model_dump(by_alias=True))
+    return JSONResponse(
+        OperationResult(is_success=False, error=ls.cache.error or "Warming up").model_dump(by_alias=True),
+        status_code=503)
+
+
+def remove_stale_socket(path: str) -> None:
+    """
+    Remove a Unix socket left behind by a previous run, refusing to take over a live one.
+
+    :param path: Socket path
+    :type path: str
+    """
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            return  # Not a socket; binding reports the conflict
+    except FileNotFoundError:
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.remove(path)  # Nothing is listening
+            return
+    raise SystemExit(f"Another server is already listening on {path}")
+
+
+def serve(host: str = "0.0.0.0", port: int = 8000) -> None:
+    """
+    Serve the API on TCP, and also on a Unix domain socket when UDS_PATH is set.
+
+    Both listeners belong to one server, so they share the lifespan (device connection,
+    sampler) and the device lock. With HTTP2 set the API is served by hypercorn instead of
+    uvicorn, accepting HTTP/2 with prior knowledge (h2c) alongside HTTP/1.1.
+
+    :param host: TCP address to bind
+    :type host: str
+    :param port: TCP port to bind
+    :type port: int
+    """
+    uds = os.getenv(UDS_PATH)
+    if uds:
+        # uvicorn re-raises the shutdown signal on exit, so a previous run's socket may remain
+        remove_stale_socket(uds)
+    if os.getenv(HTTP2, "").lower() in ("1", "true", "yes"):
+        try:
+            from hypercorn.asyncio import serve as hypercorn_serve
+            from hypercorn.config import Config
+        except ImportError:
+            raise SystemExit("HTTP2 requires the http2 extra: uv sync --extra http2")
+        config = Config()
+        config.bind = [f"{host}:{port}"] + ([f"unix:{uds}"] if uds else [])
+        asyncio.run(hypercorn_serve(app, config))
+        return
+
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=1)
+    config = uvicorn.Config("main:app", host=host, port=port, workers=1)
+    if not uds:
+        uvicorn.Server(config).run()
+        return
+    sockets = [config.bind_socket(), uvicorn.Config("main:app", uds=uds).bind_socket()]
+    uvicorn.Server(config).run(sockets=sockets)
+
+
+if __name__ == "__main__":
+    serve()
     # uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,13 +1,28 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from .dependencies import admit_device_request
 from .v1.curve import router as curve
 from .v1.device import router as device
 from .v1.reading import router as reading
+from .v1.curve_library import router as curve_library
+from .v1.alarm import router as alarm
+from .v1.metrics import router as metrics
+from .v1.batch import router as batch
+from .v1.sequence import router as sequence
+from .v1.audit import router as audit
+from .v1.admin import router as admin
 
-router_v1 = APIRouter(prefix="/api/v1")
+router_v1 = APIRouter(prefix="/api/v1", dependencies=[Depends(admit_device_request)])
 
 # Include all route modules
 router_v1.include_router(device, tags=["device"])
 router_v1.include_router(reading, tags=["reading"])
 router_v1.include_router(curve, tags=["curve"])
+router_v1.include_router(curve_library, tags=["curve-library"])
+router_v1.include_router(alarm, tags=["alarm"])
+router_v1.include_router(batch, tags=["batch"])
+router_v1.include_router(sequence, tags=["sequence"])
+router_v1.include_router(audit, tags=["audit"])
+router_v1.include_router(metrics, tags=["metrics"])
+router_v1.include_router(admin, tags=["admin"])
 
 __all__ = ["router_v1"]
@@ -1,4 +1,20 @@
+import os
+import secrets
+from collections.abc import AsyncGenerator
+
+from fastapi import Request, HTTPException
+from constants.env import ADMIN_TOKEN
 from services.lakeshore import LakeshoreService
+from services.alarms import AlarmEngine
+from services.statistics import StatisticsEngine
+from services.history import ReadingHistory
+from services.curve_library import CurveLibrary
+from services.sequence import SequenceRunner
+from services.audit import AuditJournal
+from services.admission import BODY_COSTED, OPERATION_COSTS, operation_cost
+
+# Header carrying the token required by the admin endpoints
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
 
 
 def get_lakeshore_service() -> LakeshoreService:
@@ -7,3 +23,87 @@ def get_lakeshore_service() -> LakeshoreService:
     This can be used in route handlers to access the service methods.
     """
     return LakeshoreService()
+
+
+def get_alarm_engine(request: Request) -> AlarmEngine:
+    """
+    Dependency to get the AlarmEngine attached to the reading sampler.
+    """
+    return request.app.state.alarms
+
+
+def get_statistics_engine(request: Request) -> StatisticsEngine:
+    """
+    Dependency to get the per-channel rolling StatisticsEngine.
+    """
+    return request.app.state.statistics
+
+
+def get_reading_history(request: Request) -> ReadingHistory:
+    """
+    Dependency to get the sampled ReadingHistory.
+    """
+    return request.app.state.history
+
+
+def get_curve_library(request: Request) -> CurveLibrary:
+    """
+    Dependency to get the server-side CurveLibrary.
+    """
+    return request.app.state.curve_library
+
+
+def get_sequence_runner(request: Request) -> SequenceRunner:
+    """
+    Dependency to get the background SequenceRunner.
+    """
+    return request.app.state.sequences
+
+
+def get_audit_journal(request: Request) -> AuditJournal:
+    """
+    Dependency to get the configuration-write AuditJournal.
+    """
+    return request.app.state.audit
+
+
+async def admit_device_request(request: Request) -> AsyncGenerator[None, None]:
+    """
+    Dependency applying per-client admission control to device-bound operations.
+
+    Clients are identified by a configured API key, or otherwise their IP address.
+    Rejected requests get 429 with Retry-After before reaching the device lock.
+    """
+    admission = request.app.state.admission
+    operation_id = getattr(request.scope.get("route"), "operation_id", None)
+    if not admission.enabled or operation_id not in OPERATION_COSTS:
+        yield
+        return
+    params = {**request.query_params, **request.path_params}
+    if "channels" in request.query_params:
+        params["channels"] = request.query_params.getlist("channels")
+    body = None
+    if operation_id in BODY_COSTED:
+        try:
+            body = await request.json()
+        except ValueError:
+            pass  # Rejected by body validation once admitted
+    client = admission.identify(request)
+    admission.admit(client, operation_cost(operation_id, params, body, LakeshoreService.cache))
+    try:
+        yield
+    finally:
+        admission.release(client)
+
+
+def require_admin(request: Request) -> None:
+    """
+    Dependency restricting an endpoint to holders of the ADMIN_TOKEN.
+
+    Admin endpoints are disabled (404) unless the ADMIN_TOKEN environment variable is set.
+    """
+    token = os.getenv(ADMIN_TOKEN)
+    if not token:
+        raise HTTPException(404, "Admin endpoints are disabled")
+    if not secrets.compare_digest(request.headers.get(ADMIN_TOKEN_HEADER, ""), token):
+        raise HTTPException(403, "Invalid admin token")
@@ -0,0 +1,74 @@
+from collections.abc import Callable
+
+from fastapi import HTTPException, Query
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from schemas.reading import TemperatureUnit
+from services.units import UNIT_FIELDS
+
+
+def field_selection(model: type[BaseModel]) -> Callable[[list[str] | None], set[str] | None]:
+    """
+    Build a dependency parsing the ``fields`` query parameter for a response model.
+
+    Fields may be repeated (``fields=a&fields=b``) or comma-separated (``fields=a,b``) and
+    named either in camelCase or snake_case.
+
+    :param model: Response model the fields belong to
+    :type model: type[BaseModel]
+    :return: Dependency returning the selected field names, or None for all fields
+    :rtype: Callable[[list[str] | None], set[str] | None]
+    """
+    names = {name: name for name in model.model_fields}
+    names |= {field.alias: name for name, field in model.model_fields.items() if field.alias}
+    available = ", ".join(field.alias or name for name, field in model.model_fields.items())
+
+    def dependency(
+        fields: list[str] | None = Query(None, description=f"Only return these fields: {available}")
+    ) -> set[str] | None:
+        if not fields:
+            return None
+        requested = [name.strip() for value in fields for name in value.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in names]
+        if unknown:
+            raise HTTPException(422, f"Unknown fields: {', '.join(unknown)}. Available: {available}")
+        return {names[name] for name in requested}
+
+    return dependency
+
+
+def select_fields[M: BaseModel](result: M, fields: set[str] | None) -> M | JSONResponse:
+    """
+    Return a response holding only the selected fields of a result.
+
+    :param result: Full or partially read result
+    :type result: BaseModel
+    :param fields: Field names from field_selection, or None for all fields
+    :type fields: set[str] | None
+    :return: The result itself, or a JSON response with the selected fields
+    :rtype: BaseModel | JSONResponse
+    """
+    if fields is None:
+        return result
+    return JSONResponse(result.model_dump(mode="json", by_alias=True, include=fields))
+
+
+def unit_selection(
+    units: list[str] | None = Query(None, description="Units to return: K, C, F and/or S (raw sensor)")
+) -> list[TemperatureUnit] | None:
+    """
+    Dependency parsing the ``units`` query parameter, repeated or comma-separated.
+
+    :param units: Raw query values
+    :type units: list[str] | None
+    :return: Selected units in request order, or None for the endpoint default
+    :rtype: list[TemperatureUnit] | None
+    """
+    if not units:
+        return None
+    requested = [unit.strip().upper() for value in units for unit in value.split(",") if unit.strip()]
+    unknown = [unit for unit in requested if unit not in UNIT_FIELDS]
+    if unknown:
+        raise HTTPException(422, f"Unknown units: {', '.join(unknown)}. Available: K, C, F, S")
+    return list(dict.fromkeys(requested))
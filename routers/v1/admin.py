@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+from schemas.operations import OperationResult
+from schemas.profiling import MemorySnapshot, RequestTrace
+from services.profiling import MAX_PROFILE_DURATION, sampler, tracer, memory
+from routers.dependencies import require_admin
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin)])
+
+
+@router.post("/profile", operation_id="runProfile", response_class=PlainTextResponse)
+async def run_profile(
+    duration: float = Query(10.0, gt=0, le=MAX_PROFILE_DURATION, description="Seconds to sample for"),
+    interval: float = Query(0.005, ge=0.001, le=1.0, description="Seconds between samples"),
+) -> PlainTextResponse:
+    """Sample every thread's stack and return folded stacks for flamegraph.pl or speedscope"""
+    return PlainTextResponse(await sampler.run(duration, interval))
+
+
+@router.put("/tracing", operation_id="setTracing", response_model=OperationResult)
+def set_tracing(enabled: bool = Query(..., description="Record per-request span timelines")) -> OperationResult:
+    tracer.enabled = enabled
+    if enabled:
+        tracer.clear()
+    return OperationResult(is_success=True, message=f"Request tracing {'enabled' if enabled else 'disabled'}")
+
+
+@router.get("/traces", operation_id="getTraces", response_model=list[RequestTrace])
+def get_traces(
+    limit: int = Query(50, ge=1, le=500),
+    min_duration: float = Query(0.0, alias="minDuration", ge=0, description="Only requests slower than this, in seconds"),
+) -> list[RequestTrace]:
+    """Most recent request timelines first, split into dispatch, lock_wait, device and serialize spans"""
+    return tracer.traces(limit, min_duration)
+
+
+@router.post("/tracemalloc", operation_id="startTracemalloc", response_model=OperationResult)
+def start_tracemalloc(
+    frames: int = Query(1, ge=1, le=50, description="Stack frames stored per allocation")
+) -> OperationResult:
+    memory.start(frames)
+    return OperationResult(is_success=True, message="tracemalloc started")
+
+
+@router.get("/tracemalloc", operation_id="getTracemallocSnapshot", response_model=MemorySnapshot)
+def get_tracemalloc_snapshot(limit: int = Query(25, ge=1, le=500)) -> MemorySnapshot:
+    """Take a snapshot; sizeDiff and countDiff are relative to the previous snapshot"""
+    return memory.snapshot(limit)
+
+
+@router.delete("/tracemalloc", operation_id="stopTracemalloc", response_model=OperationResult)
+def stop_tracemalloc() -> OperationResult:
+    memory.stop()
+    return OperationResult(is_success=True, message="tracemalloc stopped")
@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from schemas.alarm import AlarmEvent, AlarmThresholds
+from schemas.operations import OperationResult
+from schemas.shared import ChannelQueryParam
+from services.alarms import AlarmEngine
+from services.events import sse_stream
+from routers.dependencies import get_alarm_engine
+
+router = APIRouter(prefix="/alarm")
+
+
+@router.get("/thresholds/{channel}", operation_id="getAlarmThresholds", response_model=AlarmThresholds)
+def get_alarm_thresholds(
+    channel: int = ChannelQueryParam,
+    alarms: AlarmEngine = Depends(get_alarm_engine)
+) -> AlarmThresholds:
+    return alarms.get_thresholds(channel)
+
+
+@router.put("/thresholds/{channel}", operation_id="setAlarmThresholds")
+def set_alarm_thresholds(
+    thresholds: AlarmThresholds,
+    channel: int = ChannelQueryParam,
+    alarms: AlarmEngine = Depends(get_alarm_engine)
+) -> OperationResult:
+    alarms.set_thresholds(channel, thresholds)
+    return OperationResult(is_success=True, message="Alarm thresholds updated successfully")
+
+
+@router.get("/active", operation_id="getActiveAlarms", response_model=list[AlarmEvent])
+def get_active_alarms(alarms: AlarmEngine = Depends(get_alarm_engine)) -> list[AlarmEvent]:
+    return alarms.active()
+
+
+@router.get("/stream", operation_id="streamAlarms")
+async def stream_alarms(request: Request) -> StreamingResponse:
+    """Server-Sent Events stream of alarm state changes"""
+    return StreamingResponse(
+        sse_stream(request.app.state.events, request.is_disconnected, "alarm"),
+        media_type="text/event-stream")
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, Query
+from schemas.audit import AuditEntry
+from services.audit import AuditJournal
+from routers.dependencies import get_audit_journal, require_admin
+
+router = APIRouter(prefix="/audit", dependencies=[Depends(require_admin)])
+
+
+@router.get("", operation_id="getAuditLog", response_model=list[AuditEntry])
+def get_audit_log(
+    start: float | None = Query(None, description="Earliest wall-clock time (Unix seconds)"),
+    end: float | None = Query(None, description="Latest wall-clock time (Unix seconds)"),
+    client: str | None = Query(None, description="Only writes by this client, e.g. ip:10.0.0.5"),
+    operation: str | None = Query(None, description="Only writes by this operationId"),
+    limit: int = Query(1000, ge=1, le=10000, description="Return at most the latest entries"),
+    journal: AuditJournal = Depends(get_audit_journal)
+) -> list[AuditEntry]:
+    """Configuration writes recorded in the audit journal, oldest first"""
+    return journal.query(start, end, client, operation, limit)
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends, Request
+from schemas.batch import BatchRequest, BatchResp
+from services.batch import run_batch
+from services.lakeshore import LakeshoreService
+from routers.dependencies import get_lakeshore_service
+
+router = APIRouter(prefix="/batch")
+
+
+@router.post("", operation_id="runBatch", response_model=BatchResp)
+def batch(
+    request: Request,
+    batch_request: BatchRequest,
+    ls: LakeshoreService = Depends(get_lakeshore_service)
+) -> BatchResp:
+    """Run several operations back to back without other clients interleaving"""
+    return run_batch(ls, request, batch_request)
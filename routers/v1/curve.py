@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
-from schemas.curve import CurveDataPoint, CurveHeader, IndexQueryParam
+from fastapi.responses import JSONResponse
+from schemas.curve import CurveDataPoint, CurveHeader, IndexQueryParam, CurveFitRequest, CurveFitResp
 from schemas.shared import ChannelQueryParam
 from schemas.operations import OperationResult
 from services.lakeshore import LakeshoreService
 from schemas.curve import CurveDataPoints
+from services.curve_fit import fit_curve
 from routers.dependencies import get_lakeshore_service
+from routers.fields import field_selection, select_fields
 
 router = APIRouter(prefix="/curve")
 
@@ -13,9 +16,10 @@ router = APIRouter(prefix="/curve")
 def get_curve_header(
     request: Request,
     channel: int = ChannelQueryParam,
+    fields: set[str] | None = Depends(field_selection(CurveHeader)),
     ls: LakeshoreService = Depends(get_lakeshore_service)
-) -> CurveHeader:
-    return ls.get_curve_header(request, channel)
+) -> CurveHeader | JSONResponse:
+    return select_fields(ls.get_curve_header(request, channel), fields)
 
 
 @router.put("/{channel}/header", operation_id="setCurveHeader")
@@ -35,22 +39,24 @@ def get_curve_data_point(
     request: Request,
     channel: int = ChannelQueryParam,
     index: int = IndexQueryParam,
+    fields: set[str] | None = Depends(field_selection(CurveDataPoint)),
     ls: LakeshoreService = Depends(get_lakeshore_service)
-) -> CurveDataPoint:
-    return ls.get_curve_data_point(request, channel, index)
+) -> CurveDataPoint | JSONResponse:
+    return select_fields(ls.get_curve_data_point(request, channel, index), fields)
 
 
 @router.get("/{channel}/data-points", operation_id="getAllCurveDataPoints", response_model=CurveDataPoints)
 def get_curve_data_points(
     request: Request,
     channel: int = ChannelQueryParam,
+    fields: set[str] | None = Depends(field_selection(CurveDataPoints)),
     ls: LakeshoreService = Depends(get_lakeshore_service)
-) -> CurveDataPoints:
-    return ls.get_curve_data_points(request, channel)
+) -> CurveDataPoints | JSONResponse:
+    return select_fields(ls.get_curve_data_points(request, channel), fields)
 
 
 @router.put("/{channel}/data-point/{index}", operation_id="setCurveDataPoint")
-async def set_curve_data_point(
+def set_curve_data_point(
     request: Request,
     data_point: CurveDataPoint,
     channel: int = ChannelQueryParam,
@@ -69,3 +75,9 @@ def delete_curve(
 ) -> OperationResult:
     ls.delete_curve(request, channel)
     return OperationResult(is_success=True, message="Curve deleted successfully")
+
+
+@router.post("/fit", operation_id="fitCurve", response_model=CurveFitResp)
+def fit_curve_points(fit_request: CurveFitRequest) -> CurveFitResp:
+    """Fit raw calibration samples into a ready-to-upload 200-point curve"""
+    return fit_curve(fit_request)
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, Request
+from schemas.curve import LibraryCurve, LibraryCurveEntry
+from schemas.operations import OperationResult
+from schemas.shared import ChannelQueryParam
+from services.lakeshore import LakeshoreService
+from services.curve_library import CurveLibrary
+from routers.dependencies import get_lakeshore_service, get_curve_library
+
+router = APIRouter(prefix="/curve-library")
+
+
+@router.get("", operation_id="listLibraryCurves", response_model=list[LibraryCurveEntry])
+def list_library_curves(
+    serial_number: str | None = None,
+    curve_name: str | None = None,
+    library: CurveLibrary = Depends(get_curve_library)
+) -> list[LibraryCurveEntry]:
+    return library.list(serial_number, curve_name)
+
+
+@router.post("", operation_id="addLibraryCurve", response_model=LibraryCurveEntry)
+def add_library_curve(
+    curve: LibraryCurve,
+    library: CurveLibrary = Depends(get_curve_library)
+) -> LibraryCurveEntry:
+    return library.add(curve)
+
+
+@router.get("/{curve_id}", operation_id="getLibraryCurve", response_model=LibraryCurve)
+def get_library_curve(
+    curve_id: str,
+    library: CurveLibrary = Depends(get_curve_library)
+) -> LibraryCurve:
+    return library.get(curve_id)
+
+
+@router.delete("/{curve_id}", operation_id="deleteLibraryCurve")
+def delete_library_curve(
+    curve_id: str,
+    library: CurveLibrary = Depends(get_curve_library)
+) -> OperationResult:
+    library.delete(curve_id)
+    return OperationResult(is_success=True, message="Library curve deleted successfully")
+
+
+@router.post("/{curve_id}/assign/{channel}", operation_id="assignLibraryCurve")
+def assign_library_curve(
+    request: Request,
+    curve_id: str,
+    channel: int = ChannelQueryParam,
+    library: CurveLibrary = Depends(get_curve_library),
+    ls: LakeshoreService = Depends(get_lakeshore_service)
+) -> OperationResult:
+    changes = ls.assign_curve(request, library.get(curve_id), channel)
+    return OperationResult(is_success=True, message=f"Curve assigned, {len(changes)} settings written")
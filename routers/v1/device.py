@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, Request
-from schemas.device import IdentificationResp, StatusResp, Brightness
+from fastapi import APIRouter, BackgroundTasks, Depends, Request
+from schemas.device import IdentificationResp, StatusResp, AllStatusResp, Brightness
 from schemas.operations import OperationResult
+from schemas.config import DeviceConfig, ConfigApplyResult
 from schemas.shared import ChannelQueryParam
 from services.lakeshore import LakeshoreService
 from routers.dependencies import get_lakeshore_service
@@ -9,8 +10,13 @@ router = APIRouter(prefix="/device")
 
 
 @router.post("/connect", operation_id="connect")
-def connect(ls: LakeshoreService = Depends(get_lakeshore_service)) -> OperationResult:
+def connect(
+        request: Request,
+        background_tasks: BackgroundTasks,
+        ls: LakeshoreService = Depends(get_lakeshore_service)) -> OperationResult:
     ls.connect()
+    if not ls.is_ready():
+        background_tasks.add_task(ls.prefill, request.app)
     return OperationResult(
         is_success=True,
         message="Connected to Lakeshore Model240"
@@ -18,14 +24,22 @@ def connect(ls: LakeshoreService = Depends(get_lakeshore_service)) -> OperationR
 
 
 @router.post("/disconnect", operation_id="disconnect")
-def disconnect(ls: LakeshoreService = Depends(get_lakeshore_service)) -> OperationResult:
-    ls.disconnect()
+def disconnect(request: Request, ls: LakeshoreService = Depends(get_lakeshore_service)) -> OperationResult:
+    ls.disconnect(request.app)
     return OperationResult(is_success=True, message="Disconnected from Lakeshore Model240")
 
 
 @router.get("/identification", operation_id="getIdentification", response_model=IdentificationResp)
-def get_identification(ls: LakeshoreService = Depends(get_lakeshore_service)) -> IdentificationResp:
-    return ls.get_identification()
+def get_identification(request: Request, ls: LakeshoreService = Depends(get_lakeshore_service)) -> IdentificationResp:
+    return ls.get_identification(request)
+
+
+@router.get("/status", operation_id="getAllStatus", response_model=AllStatusResp)
+def get_all_status(
+        request: Request,
+        compact: bool = False,
+        ls: LakeshoreService = Depends(get_lakeshore_service)) -> AllStatusResp:
+    return ls.get_all_status(request, compact)
 
 
 @router.get("/status/{channel}", operation_id="getStatus", response_model=StatusResp)
@@ -67,3 +81,19 @@ def set_factory_defaults(request: Request, ls: LakeshoreService = Depends(get_la
     """Reset to factory defaults"""
     ls.set_factory_defaults(request)
     return OperationResult(is_success=True, message="Factory defaults restored")
+
+
+@router.get("/config", operation_id="getDeviceConfig", response_model=DeviceConfig)
+def get_device_config(request: Request, ls: LakeshoreService = Depends(get_lakeshore_service)) -> DeviceConfig:
+    """Export a snapshot of the full device configuration"""
+    return ls.get_config(request)
+
+
+@router.put("/config", operation_id="setDeviceConfig", response_model=ConfigApplyResult)
+def set_device_config(
+        request: Request,
+        config: DeviceConfig,
+        dry_run: bool = False,
+        ls: LakeshoreService = Depends(get_lakeshore_service)) -> ConfigApplyResult:
+    """Apply a configuration snapshot, writing only the settings that differ"""
+    return ls.apply_config(request, config, dry_run)
@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from services.metrics import metrics
+
+router = APIRouter(prefix="/metrics")
+
+
+@router.get("", operation_id="getMetrics")
+def get_metrics() -> dict[str, int]:
+    return metrics.snapshot()
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, Request, HTTPException
+from fastapi import APIRouter, Depends, Request, HTTPException, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from schemas.operations import OperationResult
-from schemas.reading import MonitorResp
+from schemas.reading import MonitorResp, BurstResp, HistoryResp, ResampleMethod, TemperatureUnit, ChannelStats, StatsConfig, SamplingConfig, SamplingStatus
 from schemas.shared import ChannelQueryParam
 from services.lakeshore import LakeshoreService
+from services.statistics import StatisticsEngine
+from services.history import ReadingHistory
+from services.events import sse_stream
+from services.units import UNIT_FIELDS, reading_units
 from schemas.reading import InputParameter
-from routers.dependencies import get_lakeshore_service
+from routers.dependencies import get_lakeshore_service, get_statistics_engine, get_reading_history
+from routers.fields import field_selection, select_fields, unit_selection
 
 router = APIRouter(prefix="/reading")
 
@@ -13,9 +19,10 @@ router = APIRouter(prefix="/reading")
 def get_input_parameter(
     request: Request,
     channel: int = ChannelQueryParam,
+    fields: set[str] | None = Depends(field_selection(InputParameter)),
     ls: LakeshoreService = Depends(get_lakeshore_service)
-) -> InputParameter:
-    return ls.get_input_parameter(request, channel)
+) -> InputParameter | JSONResponse:
+    return select_fields(ls.get_input_parameter(request, channel, fields), fields)
 
 
 @router.put("/input/{channel}", operation_id="setInputParameter")
@@ -28,13 +35,109 @@ def set_input_config(
     return OperationResult(is_success=True, message="Input configuration updated successfully")
 
 
-@router.get("/monitor/{channel}", operation_id="getMonitor", response_model=MonitorResp)
+@router.get("/monitor/{channel}", operation_id="getMonitor", response_model=MonitorResp,
+            response_model_exclude_none=True)
 def get_monitor(
     request: Request,
     channel: int = ChannelQueryParam,
+    fields: set[str] | None = Depends(field_selection(MonitorResp)),
+    units: list[TemperatureUnit] | None = Depends(unit_selection),
     ls: LakeshoreService = Depends(get_lakeshore_service)
-) -> MonitorResp:
-    return ls.get_monitor(request, channel)
+) -> MonitorResp | JSONResponse:
+    if units is not None:
+        fields = (fields or set()) | {UNIT_FIELDS[unit] for unit in units}
+    return select_fields(ls.get_monitor(request, channel, fields), fields)
+
+
+@router.get("/monitor/{channel}/burst", operation_id="getMonitorBurst", response_model=BurstResp,
+            response_model_exclude_unset=True)
+def get_monitor_burst(
+    request: Request,
+    channel: int = ChannelQueryParam,
+    n: int = Query(10, ge=1, le=500, description="Number of readings per channel"),
+    channels: list[int] = Query([], description="Additional channels to read in the same burst"),
+    units: list[TemperatureUnit] | None = Depends(unit_selection),
+    ls: LakeshoreService = Depends(get_lakeshore_service)
+) -> BurstResp:
+    """Average n back-to-back readings taken in one device session"""
+    if any(not 1 <= channel <= 8 for channel in channels):
+        raise HTTPException(status_code=422, detail="Channels must be between 1 and 8")
+    return ls.get_monitor_burst(request, list(dict.fromkeys([channel, *channels])), n, units)
+
+
+@router.get("/history", operation_id="getReadingHistory", response_model=HistoryResp,
+            response_model_exclude_unset=True)
+def get_reading_history(
+    channels: list[int] = Query([1, 2, 3, 4, 5, 6, 7, 8], description="Channels to include"),
+    start: float | None = Query(None, description="Earliest wall-clock time (Unix seconds)"),
+    end: float | None = Query(None, description="Latest wall-clock time (Unix seconds)"),
+    step: float | None = Query(None, gt=0, description="Grid spacing in seconds; default is every sample time"),
+    method: ResampleMethod = Query("linear", description="Interpolate, or carry the previous reading forward"),
+    units: list[TemperatureUnit] | None = Depends(unit_selection),
+    history: ReadingHistory = Depends(get_reading_history)
+) -> HistoryResp:
+    """Sampled readings of several channels resampled onto a common time grid"""
+    if any(not 1 <= channel <= 8 for channel in channels):
+        raise HTTPException(status_code=422, detail="Channels must be between 1 and 8")
+    return history.query(list(dict.fromkeys(channels)), start, end, step, method, units)
+
+
+@router.get("/stats/{channel}", operation_id="getReadingStats", response_model=ChannelStats)
+def get_reading_stats(
+    channel: int = ChannelQueryParam,
+    stats: StatisticsEngine = Depends(get_statistics_engine)
+) -> ChannelStats:
+    return stats.get_stats(channel)
+
+
+@router.get("/stats/{channel}/config", operation_id="getReadingStatsConfig", response_model=StatsConfig)
+def get_reading_stats_config(
+    channel: int = ChannelQueryParam,
+    stats: StatisticsEngine = Depends(get_statistics_engine)
+) -> StatsConfig:
+    return stats.get_config(channel)
+
+
+@router.put("/stats/{channel}/config", operation_id="setReadingStatsConfig")
+def set_reading_stats_config(
+    config: StatsConfig,
+    channel: int = ChannelQueryParam,
+    stats: StatisticsEngine = Depends(get_statistics_engine)
+) -> OperationResult:
+    stats.set_config(channel, config)
+    return OperationResult(is_success=True, message="Statistics configuration updated successfully")
+
+
+@router.get("/sampling/{channel}", operation_id="getSamplingConfig", response_model=SamplingStatus)
+def get_sampling_config(
+    request: Request,
+    channel: int = ChannelQueryParam,
+    ls: LakeshoreService = Depends(get_lakeshore_service)
+) -> SamplingStatus:
+    return ls.get_sampling_config(request, channel)
+
+
+@router.put("/sampling/{channel}", operation_id="setSamplingConfig")
+def set_sampling_config(
+    request: Request,
+    config: SamplingConfig,
+    channel: int = ChannelQueryParam,
+    ls: LakeshoreService = Depends(get_lakeshore_service)
+) -> OperationResult:
+    ls.set_sampling_config(request, config, channel)
+    return OperationResult(is_success=True, message="Sampling configuration updated successfully")
+
+
+@router.get("/stream", operation_id="streamReadings")
+async def stream_readings(
+    request: Request,
+    units: list[TemperatureUnit] | None = Depends(unit_selection)
+) -> StreamingResponse:
+    """Server-Sent Events stream of sampled readings and stability changes"""
+    return StreamingResponse(
+        sse_stream(request.app.state.events, request.is_disconnected, "reading", "stability",
+                   transform=reading_units(units) if units else None),
+        media_type="text/event-stream")
 
 
 # Missing endpoints that return 501 Not Implemented
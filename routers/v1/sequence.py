@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, Request
+from schemas.sequence import SequenceRequest, SequenceResult, SequenceStatus
+from services.sequence import SequenceRunner
+from routers.dependencies import get_sequence_runner
+
+router = APIRouter(prefix="/sequence")
+
+
+@router.post("", operation_id="submitSequence", response_model=SequenceStatus)
+def submit_sequence(
+    request: Request,
+    sequence: SequenceRequest,
+    runner: SequenceRunner = Depends(get_sequence_runner)
+) -> SequenceStatus:
+    """Queue a measurement sequence to run in the background"""
+    return runner.submit(sequence, request)
+
+
+@router.get("", operation_id="listSequences", response_model=list[SequenceStatus])
+def list_sequences(runner: SequenceRunner = Depends(get_sequence_runner)) -> list[SequenceStatus]:
+    return runner.list()
+
+
+@router.get("/{sequence_id}", operation_id="getSequence", response_model=SequenceStatus)
+def get_sequence(
+    sequence_id: str,
+    runner: SequenceRunner = Depends(get_sequence_runner)
+) -> SequenceStatus:
+    return runner.get(sequence_id)
+
+
+@router.get("/{sequence_id}/result", operation_id="getSequenceResult", response_model=SequenceResult)
+def get_sequence_result(
+    sequence_id: str,
+    runner: SequenceRunner = Depends(get_sequence_runner)
+) -> SequenceResult:
+    return runner.get_result(sequence_id)
+
+
+@router.delete("/{sequence_id}", operation_id="cancelSequence", response_model=SequenceStatus)
+def cancel_sequence(
+    sequence_id: str,
+    runner: SequenceRunner = Depends(get_sequence_runner)
+) -> SequenceStatus:
+    """Cancel a queued or running sequence"""
+    return runner.cancel(sequence_id)
@@ -0,0 +1,39 @@
+from typing import Literal
+from pydantic import Field
+from fastapi_camelcase import CamelModel
+
+StatusFlag = Literal[
+    "invalid_reading",
+    "temp_under_range",
+    "temp_over_range",
+    "sensor_units_over_range",
+    "sensor_units_under_range",
+]
+
+
+class AlarmThresholds(CamelModel):
+    """Schema for the alarm limits of a single channel.
+
+    Used by GET/PUT /alarm/thresholds/{channel} endpoints. Unset limits are not evaluated.
+    """
+
+    high: float | None = Field(default=None, description="Alarm when kelvin exceeds this value")
+    low: float | None = Field(default=None, description="Alarm when kelvin falls below this value")
+    rate_of_change: float | None = Field(
+        default=None, gt=0, description="Alarm when |dK/dt| exceeds this value (K/s)")
+    status_flags: list[StatusFlag] = Field(
+        default_factory=list, description="Status flags that raise an alarm when set")
+
+
+class AlarmEvent(CamelModel):
+    """Schema for an alarm state change.
+
+    Sent on GET /alarm/stream and to the webhook, and listed by GET /alarm/active.
+    """
+
+    channel: int
+    kind: str = Field(..., description="high, low, rate_of_change or a status flag name")
+    active: bool
+    value: float | None = None
+    threshold: float | None = None
+    timestamp: float
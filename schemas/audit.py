@@ -0,0 +1,21 @@
+from typing import Any, Literal
+
+from pydantic import Field
+from fastapi_camelcase import CamelModel
+
+FsyncPolicy = Literal["none", "batch", "always"]
+
+
+class AuditEntry(CamelModel):
+    """Schema for one configuration write recorded in the audit journal.
+
+    Used by GET /audit endpoint.
+    """
+
+    timestamp: float = Field(..., description="Wall-clock time of the write (Unix seconds)")
+    client: str = Field(..., description="key:<hash of a configured X-API-Key>, ip:<address> or local")
+    operation: str = Field(..., description="operationId of the write")
+    channel: int | None = None
+    before: Any = Field(None, description="Cached value before the write, if it was cached")
+    after: Any = Field(None, description="Value written")
+    error: str | None = Field(None, description="Failure message, if the write failed")
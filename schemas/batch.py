@@ -0,0 +1,44 @@
+from typing import Any
+from pydantic import Field
+from fastapi_camelcase import CamelModel
+
+
+class BatchOperation(CamelModel):
+    """Schema for one operation in a batch, named by its endpoint's operation_id.
+
+    ``params`` holds the path/query parameters (e.g. ``channel``, ``index``) and ``body``
+    the request body the endpoint would take.
+    """
+
+    operation_id: str = Field(..., description="operation_id of the equivalent endpoint, e.g. getMonitor")
+    params: dict[str, Any] = Field(default_factory=dict)
+    body: Any = None
+
+
+class BatchRequest(CamelModel):
+    """Schema for an ordered list of operations run in one device session.
+
+    Used by POST /batch endpoint.
+    """
+
+    operations: list[BatchOperation] = Field(..., min_length=1, max_length=500)
+
+
+class BatchResult(CamelModel):
+    """Schema for the outcome of one batch operation."""
+
+    operation_id: str
+    is_success: bool
+    result: Any = None
+    error: str | None = None
+
+
+class BatchResp(CamelModel):
+    """Schema for the results of a batch, in request order.
+
+    Execution stops at the first failing operation; the remaining ones are reported as
+    not run.
+    """
+
+    completed: int
+    results: list[BatchResult]
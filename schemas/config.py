@@ -0,0 +1,40 @@
+from pydantic import Field
+from fastapi_camelcase import CamelModel
+from schemas.curve import CurveHeader, CurveDataPoints
+from schemas.reading import InputParameter
+
+# Bump when the snapshot layout changes incompatibly
+CONFIG_VERSION = 1
+
+
+class ChannelConfig(CamelModel):
+    """Schema for the full configuration of one input channel."""
+
+    channel: int = Field(..., ge=1, le=8)
+    input_parameter: InputParameter
+    curve_header: CurveHeader
+    curve: CurveDataPoints
+
+
+class DeviceConfig(CamelModel):
+    """Schema for a versioned snapshot of the whole device configuration.
+
+    Used by GET/PUT /device/config endpoints. On PUT, channels that are left out are not
+    touched and a null brightness is ignored.
+    """
+
+    version: int = CONFIG_VERSION
+    module_name: str
+    brightness: int | None = Field(default=None, ge=0, le=100)
+    channels: list[ChannelConfig]
+
+
+class ConfigApplyResult(CamelModel):
+    """Schema for the outcome of applying a configuration snapshot.
+
+    Lists every setting that differed from the device and was written (or would be, on a
+    dry run).
+    """
+
+    dry_run: bool
+    changes: list[str]
@@ -42,3 +42,53 @@ class CurveDataPoints(CamelModel):
 
 IndexQueryParam = Path(
     ..., ge=1, le=200, description="Index of the data point in the curve")
+
+
+class LibraryCurve(CamelModel):
+    """Schema for a calibration curve stored in the server-side curve library.
+
+    Used by POST /curve-library and GET /curve-library/{curve_id} endpoints.
+    """
+
+    header: CurveHeader
+    temperatures: list[float] = Field(..., min_length=200, max_length=200)
+    sensors: list[float] = Field(..., min_length=200, max_length=200)
+
+
+class LibraryCurveEntry(CamelModel):
+    """Schema for a curve library index entry (header only, without points).
+
+    Used by GET /curve-library endpoint to list and search stored curves.
+    """
+
+    curve_id: str
+    header: CurveHeader
+
+
+class CurveFitRequest(CamelModel):
+    """Schema for raw calibration measurements to fit into a Model240 curve.
+
+    Used by POST /curve/fit endpoint. ``header`` supplies the temperature limit and
+    coefficient the fitted curve is validated against.
+    """
+
+    channel: int = Field(..., ge=1, le=8, description="Channel the fitted curve is intended for")
+    header: CurveHeader
+    sensors: list[float] = Field(..., min_length=2, description="Measured sensor values")
+    temperatures: list[float] = Field(..., min_length=2, description="Reference temperatures in kelvin")
+
+
+class CurveFitResp(CamelModel):
+    """Schema for a fitted 200-point curve with its error and validation report.
+
+    Used by POST /curve/fit endpoint. ``curve`` can be uploaded as-is when ``valid`` is true,
+    i.e. when there are no ``errors``.
+    """
+
+    curve: CurveDataPoints
+    valid: bool
+    max_error: float = Field(..., description="Max interpolation error of the curve vs. the fitted data, in kelvin")
+    rms_error: float = Field(..., description="RMS interpolation error of the curve vs. the fitted data, in kelvin")
+    residual_rms: float = Field(..., description="RMS difference between the curve and the raw samples, in kelvin")
+    errors: list[str] = Field(default_factory=list)
+    warnings: list[str] = Field(default_factory=list)
@@ -35,3 +35,17 @@ class StatusResp(CamelModel):
     temp_over_range: bool = Field(...)
     sensor_units_over_range: bool = Field(...)
     sensor_units_under_range: bool = Field(...)
+
+
+class AllStatusResp(CamelModel):
+    """Schema for the status of every channel, read in one device pass.
+
+    Used by GET /status endpoint. ``bitmasks`` holds the raw RDGST? value per channel
+    (index 0 is channel 1); ``channels`` holds the decoded flags unless the compact form
+    was requested.
+    """
+
+    bitmasks: list[int] = Field(..., description="Status bitmask per channel")
+    channels: list[StatusResp] | None = Field(default=None)
+    sampled_at: float | None = Field(
+        default=None, description="Sample timestamp when served from the sampler cache")
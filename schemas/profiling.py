@@ -0,0 +1,45 @@
+from pydantic import Field
+from fastapi_camelcase import CamelModel
+
+
+class Span(CamelModel):
+    """Schema for one timed stage of a request, relative to its arrival."""
+
+    name: str = Field(..., description="dispatch, lock_wait, device or serialize")
+    start: float = Field(..., description="Seconds after the request was received")
+    duration: float
+
+
+class RequestTrace(CamelModel):
+    """Schema for the span timeline of one request.
+
+    Used by GET /admin/traces endpoint.
+    """
+
+    method: str
+    path: str
+    status_code: int
+    started_at: float = Field(..., description="Wall-clock time the request was received")
+    duration: float
+    spans: list[Span]
+
+
+class MemoryStat(CamelModel):
+    """Schema for the memory allocated from one source line."""
+
+    location: str
+    size: int = Field(..., description="Bytes currently allocated")
+    size_diff: int = Field(..., description="Change since the previous snapshot")
+    count: int
+    count_diff: int
+
+
+class MemorySnapshot(CamelModel):
+    """Schema for a tracemalloc snapshot, largest allocation sites first.
+
+    Used by GET /admin/tracemalloc endpoint.
+    """
+
+    traced_current: int
+    traced_peak: int
+    stats: list[MemoryStat]
@@ -1,16 +1,62 @@
+from typing import Literal
 from lakeshore.model_240_enums import Model240Enums
+from pydantic import Field
 from fastapi_camelcase import CamelModel
 
+ResampleMethod = Literal["linear", "previous"]
+
+# Kelvin, Celsius, Fahrenheit, or the raw sensor reading
+TemperatureUnit = Literal["K", "C", "F", "S"]
+
 
 class MonitorResp(CamelModel):
     """Schema for temperature and sensor monitoring data.
 
     Used by GET /monitor/{channel} endpoint to return current readings.
-    Currently returns kelvin temperature and raw sensor value.
+    Currently returns kelvin temperature and raw sensor value; fields not selected
+    with ``fields=`` are not read from the device and left unset.
+    """
+
+    kelvin: float | None = None
+    celsius: float | None = None
+    fahrenheit: float | None = None
+    sensor: float | None = None
+
+
+class BurstStats(CamelModel):
+    """Schema for summary statistics of one quantity over a burst of readings."""
+
+    mean: float
+    stddev: float = Field(..., description="Sample standard deviation, 0 for a single reading")
+    min: float
+    max: float
+
+
+class ChannelBurst(CamelModel):
+    """Schema for the burst readings of one channel.
+
+    ``interval`` describes the spread of the time between consecutive readings of the
+    channel and is null when only one reading was taken. Only the requested units are set.
+    """
+
+    channel: int
+    count: int
+    kelvin: BurstStats | None = None
+    celsius: BurstStats | None = None
+    fahrenheit: BurstStats | None = None
+    sensor: BurstStats | None = None
+    interval: BurstStats | None = Field(default=None, description="Seconds between consecutive readings")
+
+
+class BurstResp(CamelModel):
+    """Schema for a burst of back-to-back monitor readings.
+
+    Used by GET /monitor/{channel}/burst endpoint.
     """
 
-    kelvin: float
-    sensor: float
+    started_at: float = Field(..., description="Wall-clock time of the first reading")
+    duration: float = Field(..., description="Seconds from the first reading to the end of the last")
+    channels: list[ChannelBurst]
 
 
 class InputParameter(CamelModel):
@@ -28,3 +74,115 @@ class InputParameter(CamelModel):
     input_enable: bool
     input_range: int
     filter: str | None = None  # Optional filter setting, None if not applicable
+
+
+class ReadingEvent(CamelModel):
+    """Schema for a single sampled reading.
+
+    Sent as ``reading`` events on GET /reading/stream. Celsius and Fahrenheit are only
+    included when requested with ``units=``.
+    """
+
+    channel: int
+    timestamp: float
+    kelvin: float | None = None
+    celsius: float | None = None
+    fahrenheit: float | None = None
+    sensor: float | None = None
+    status: int = Field(..., description="RDGST? status bitmask")
+
+
+class StatsConfig(CamelModel):
+    """Schema for a channel's rolling statistics window and stability criteria.
+
+    Used by GET/PUT /stats/{channel}/config endpoints. A channel is stable when its
+    window is filled and every reading lies within ``tolerance`` of the window mean.
+    """
+
+    window: float = Field(default=600.0, gt=0, description="Window length in seconds")
+    tolerance: float = Field(default=0.005, gt=0, description="Stability band around the mean in kelvin")
+    max_slope: float | None = Field(
+        default=None, gt=0, description="Optional limit on |slope| in K/s for stability")
+
+
+class ChannelStats(CamelModel):
+    """Schema for rolling kelvin statistics of a channel.
+
+    Used by GET /stats/{channel} endpoint and carried by stability events.
+    """
+
+    channel: int
+    window: float
+    count: int
+    span: float = Field(..., description="Time covered by the samples in the window, in seconds")
+    mean: float | None = None
+    stddev: float | None = None
+    min: float | None = None
+    max: float | None = None
+    slope: float | None = Field(default=None, description="Least-squares slope in K/s")
+    stable: bool
+    stable_since: float | None = None
+
+
+class StabilityEvent(CamelModel):
+    """Schema for a channel entering or leaving its stability band.
+
+    Sent as ``stability`` events on GET /reading/stream.
+    """
+
+    stats: ChannelStats
+    timestamp: float
+
+
+class SamplingConfig(CamelModel):
+    """Schema for a channel's background sampling rate.
+
+    Used by PUT /sampling/{channel} endpoint. When the channel's rate of change exceeds
+    ``rate_threshold`` it is sampled every ``fast_interval`` instead of ``interval``.
+    """
+
+    enabled: bool = True
+    interval: float = Field(default=1.0, gt=0, description="Target sampling interval in seconds")
+    fast_interval: float | None = Field(
+        default=None, gt=0, description="Interval used while the channel is changing fast")
+    rate_threshold: float | None = Field(
+        default=None, gt=0, description="|dK/dt| in K/s above which fast_interval is used")
+
+
+class SamplingStatus(CamelModel):
+    """Schema for a channel's sampling configuration and current scheduler state.
+
+    Used by GET /sampling/{channel} endpoint.
+    """
+
+    channel: int
+    config: SamplingConfig
+    input_enabled: bool | None = Field(
+        default=None, description="Device input_enable flag; disabled inputs are not polled")
+    fast: bool = Field(..., description="Whether the fast interval is currently in effect")
+    effective_interval: float
+
+
+class HistorySeries(CamelModel):
+    """Schema for one channel's column of a history table.
+
+    Entries are null where the channel has no reading to resample from. Only the
+    requested units are set.
+    """
+
+    channel: int
+    kelvin: list[float | None] | None = None
+    celsius: list[float | None] | None = None
+    fahrenheit: list[float | None] | None = None
+    sensor: list[float | None] | None = None
+
+
+class HistoryResp(CamelModel):
+    """Schema for the sampled history of several channels on a common time grid.
+
+    Used by GET /history endpoint. Row ``i`` of every series belongs to ``timestamps[i]``.
+    """
+
+    method: ResampleMethod
+    timestamps: list[float]
+    series: list[HistorySeries]
@@ -0,0 +1,95 @@
+from typing import Annotated, Any, Literal
+from pydantic import Field
+from fastapi_camelcase import CamelModel
+
+from schemas.batch import BatchOperation
+from schemas.reading import TemperatureUnit
+
+SequenceState = Literal["pending", "running", "completed", "failed", "cancelled"]
+
+
+class OperationStep(BatchOperation):
+    """Schema for a sequence step running one API operation, as in a batch."""
+
+    kind: Literal["operation"] = "operation"
+
+
+class WaitStableStep(CamelModel):
+    """Schema for a sequence step that polls a channel until its kelvin reading settles.
+
+    The channel is settled once every reading over the last ``window`` seconds lies within
+    ``tolerance`` of their mean. The step fails if that does not happen within ``timeout``.
+    """
+
+    kind: Literal["waitStable"] = "waitStable"
+    channel: int = Field(..., ge=1, le=8)
+    tolerance: float = Field(default=0.005, gt=0, description="Stability band around the mean in kelvin")
+    window: float = Field(default=60.0, gt=0, description="Seconds the reading must stay within the band")
+    poll_interval: float = Field(default=1.0, gt=0, description="Seconds between readings")
+    timeout: float = Field(default=3600.0, gt=0, description="Seconds to wait before failing the step")
+
+
+class SampleStep(CamelModel):
+    """Schema for a sequence step taking a burst of readings, as GET /monitor/{channel}/burst."""
+
+    kind: Literal["sample"] = "sample"
+    channels: list[Annotated[int, Field(ge=1, le=8)]] = Field(..., min_length=1, max_length=8)
+    n: int = Field(default=10, ge=1, le=500, description="Number of readings per channel")
+    units: list[TemperatureUnit] | None = Field(default=None, description="Units to summarize, default K and S")
+
+
+class DelayStep(CamelModel):
+    """Schema for a sequence step that waits for a fixed time."""
+
+    kind: Literal["delay"] = "delay"
+    seconds: float = Field(..., ge=0)
+
+
+SequenceStep = Annotated[OperationStep | WaitStableStep | SampleStep | DelayStep, Field(discriminator="kind")]
+
+
+class SequenceRequest(CamelModel):
+    """Schema for a measurement sequence run as a background job.
+
+    Used by POST /sequence endpoint.
+    """
+
+    name: str | None = None
+    steps: list[SequenceStep] = Field(..., min_length=1, max_length=1000)
+
+
+class StepResult(CamelModel):
+    """Schema for the outcome of one sequence step."""
+
+    index: int
+    kind: str
+    is_success: bool
+    result: Any = None
+    error: str | None = None
+    started_at: float
+    finished_at: float
+
+
+class SequenceStatus(CamelModel):
+    """Schema for the progress of a sequence job.
+
+    ``current_step`` is the zero-based index of the step being run, or the number of
+    completed steps once the job has finished.
+    """
+
+    id: str
+    name: str | None = None
+    state: SequenceState
+    current_step: int
+    total_steps: int
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+
+
+class SequenceResult(CamelModel):
+    """Schema for the step results of a sequence job, available while it runs."""
+
+    status: SequenceStatus
+    results: list[StepResult]
@@ -0,0 +1,278 @@
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+import numpy as np
+from fastapi import HTTPException, Request
+
+from services.cache import DeviceCache
+from services.metrics import metrics
+
+# Header identifying a client by one of the configured API keys; clients without a known
+# key are told apart by IP address
+API_KEY_HEADER = "X-API-Key"
+
+# Seconds after its last request that a client stops counting towards the fair share
+ACTIVE_WINDOW = 10.0
+
+Cost = float | Callable[[dict[str, Any], Any, DeviceCache], float]
+
+
+def _int(params: dict[str, Any], name: str, default: int) -> int:
+    try:
+        return int(params.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _curve_cost(params: dict[str, Any], body: Any, cache: DeviceCache) -> float:
+    return 1 if _int(params, "channel", 0) in cache.curves else 200
+
+
+def _config_cost(params: dict[str, Any], body: Any, cache: DeviceCache) -> float:
+    # Reads for the snapshot entries missing from the cache
+    cost = (cache.modname is None) + (cache.brightness is None)
+    for channel in range(1, 9):
+        cost += ((channel not in cache.input_parameters) * 3 + (channel not in cache.curve_headers)
+                 + (channel not in cache.curves) * 200)
+    return cost
+
+
+def _changed_points(curve: Any, cached: Any) -> int:
+    # Same tolerance as the diff that decides which points are written
+    try:
+        sensors, temperatures = np.asarray(curve["sensors"], float), np.asarray(curve["temperatures"], float)
+        same = (np.isclose(sensors, cached.sensors, rtol=1e-6, atol=1e-9)
+                & np.isclose(temperatures, cached.temperatures, rtol=1e-6, atol=1e-9))
+    except (KeyError, TypeError, ValueError):
+        return 200
+    return int((~same).sum())
+
+
+def _config_write_cost(params: dict[str, Any], body: Any, cache: DeviceCache) -> float:
+    # Writes of the diff between the body and the cache; uncached settings count as changed
+    if str(params.get("dry_run", "")).lower() in ("1", "true", "yes", "on"):
+        return 0
+    if not isinstance(body, dict) or not isinstance(body.get("channels"), list):
+        return 1
+    cost = int(body.get("moduleName") != cache.modname)
+    cost += body.get("brightness") is not None and body.get("brightness") != cache.brightness
+    for wanted in body["channels"]:
+        if not isinstance(wanted, dict):
+            continue
+        channel = wanted.get("channel")
+        have = cache.input_parameters.get(channel)
+        param = wanted.get("inputParameter")
+        if not isinstance(param, dict) or have is None:
+            cost += 3
+        else:
+            current = have.model_dump(mode="json", by_alias=True)
+            cost += any(current.get(k) != v for k, v in param.items() if k not in ("sensorName", "filter"))
+            cost += sum(bool(param.get(k)) and param.get(k) != current.get(k) for k in ("sensorName", "filter"))
+        header = cache.curve_headers.get(channel)
+        cost += header is None or header.model_dump(mode="json", by_alias=True) != wanted.get("curveHeader")
+        curve = cache.curves.get(channel)
+        cost += 200 if curve is None else _changed_points(wanted.get("curve"), curve)
+    return cost
+
+
+def _apply_config_cost(params: dict[str, Any], body: Any, cache: DeviceCache) -> float:
+    return _config_cost(params, body, cache) + _config_write_cost(params, body, cache)
+
+
+def _assign_cost(params: dict[str, Any], body: Any, cache: DeviceCache) -> float:
+    # The library curve is not known here, so at least one write is charged on top of the reads
+    channel = _int(params, "channel", 0)
+    return 1 + (channel not in cache.curve_headers) + (channel not in cache.curves) * 200
+
+
+def _burst_cost(params: dict[str, Any], body: Any, cache: DeviceCache) -> float:
+    channels = params.get("channels", [])
+    return 2 * _int(params, "n", 10) * (1 + (len(channels) if isinstance(channels, list) else 1))
+
+
+def _batch_cost(params: dict[str, Any], body: Any, cache: DeviceCache) -> float:
+    if not isinstance(body, dict) or not isinstance(body.get("operations"), list):
+        return 1
+    return sum(operation_cost(op.get("operationId", ""), op.get("params") or {}, op.get("body"), cache)
+               for op in body["operations"] if isinstance(op, dict))
+
+
+def _float(params: dict[str, Any], name: str, default: float) -> float:
+    try:
+        return float(params.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _sequence_cost(params: dict[str, Any], body: Any, cache: DeviceCache) -> float:
+    # A wait step costs at least the readings needed to settle; its timeout is not charged
+    if not isinstance(body, dict) or not isinstance(body.get("steps"), list):
+        return 1
+    cost = 0.0
+    for step in body["steps"]:
+        if not isinstance(step, dict):
+            continue
+        match step.get("kind"):
+            case "operation":
+                cost += operation_cost(step.get("operationId", ""), step.get("params") or {}, step.get("body"), cache)
+            case "sample":
+                channels = step.get("channels")
+                cost += 2 * _int(step, "n", 10) * (len(channels) if isinstance(channels, list) else 1)
+            case "waitStable":
+                cost += math.ceil(_float(step, "window", 60.0) / max(_float(step, "pollInterval", 1.0), 1e-3))
+    return cost
+
+
+# Device commands issued by each operation on a cache miss; unlisted operations do not
+# touch the device and are not rate limited
+OPERATION_COSTS: dict[str, Cost] = {
+    "connect": 1,
+    "disconnect": 1,
+    "getIdentification": 1,
+    "getStatus": 1,
+    "getAllStatus": 8,
+    "getModuleName": 1,
+    "setModuleName": 1,
+    "getBrightness": 1,
+    "setBrightness": 1,
+    "setFactoryDefaults": 1,
+    "getDeviceConfig": _config_cost,
+    "setDeviceConfig": _apply_config_cost,
+    "getInputParameter": 3,
+    "setInputParameter": 4,
+    "getMonitor": 2,
+    "getMonitorBurst": _burst_cost,
+    "getCurveHeader": 1,
+    "setCurveHeader": 1,
+    "getCurveDataPoint": 1,
+    "getAllCurveDataPoints": _curve_cost,
+    "setCurveDataPoint": 1,
+    "deleteCurve": 1,
+    "assignLibraryCurve": _assign_cost,
+    "runBatch": _batch_cost,
+    "submitSequence": _sequence_cost,
+}
+
+# Operations whose cost depends on their JSON body
+BODY_COSTED = {"runBatch", "submitSequence", "setDeviceConfig"}
+
+
+def operation_cost(operation_id: str, params: dict[str, Any], body: Any, cache: DeviceCache) -> float:
+    """
+    Estimate the device commands an operation will issue.
+
+    :param operation_id: operation_id of the endpoint
+    :type operation_id: str
+    :param params: Path and query parameters
+    :type params: dict[str, Any]
+    :param body: Decoded JSON request body, if any
+    :type body: Any
+    :param cache: Device cache, to discount reads that will be served from it
+    :type cache: DeviceCache
+    :return: Estimated device commands, 0 for operations that do not use the device
+    :rtype: float
+    """
+    cost = OPERATION_COSTS.get(operation_id, 0)
+    return cost(params, body, cache) if callable(cost) else cost
+
+
+@dataclass
+class ClientBudget:
+    tokens: float
+    refilled: float = field(default_factory=time.monotonic)
+    last_seen: float = field(default_factory=time.monotonic)
+    in_flight: int = 0
+
+
+class AdmissionController:
+    """
+    Per-client token buckets sharing the device's command bandwidth fairly.
+
+    ``rate`` device commands per second are split evenly between the clients active in
+    the last few seconds; each client's bucket holds up to ``burst`` commands. A request
+    is admitted once its client's bucket covers its cost (or is full, for operations
+    costing more than ``burst``), and the full cost is then charged, so an expensive
+    request delays that client's next ones rather than everyone's. Clients may have at
+    most ``max_queue`` device requests waiting or running, and all clients together
+    ``max_total``; excess requests are rejected at once with 429 and Retry-After.
+
+    Keys are not otherwise authenticated, so only those in ``api_keys`` identify a client;
+    a request with any other key is identified by its IP address, as without one.
+    """
+
+    def __init__(self, rate: float, burst: float, max_queue: int = 8, max_total: int = 64,
+                 api_keys: frozenset[str] = frozenset()) -> None:
+        self.rate = rate
+        self.api_keys = api_keys
+        self.burst = burst
+        self.max_queue = max_queue
+        self.max_total = max_total
+        self._lock = Lock()
+        self._clients: dict[str, ClientBudget] = {}
+        self._in_flight = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def identify(self, request: Request) -> str:
+        """Return ``key:<key>`` for a configured API key, else ``ip:<address>`` (or ``local``)."""
+        key = request.headers.get(API_KEY_HEADER)
+        if key and key in self.api_keys:
+            return f"key:{key}"
+        return f"ip:{request.client.host}" if request.client else "local"
+
+    def _share(self, now: float) -> float:
+        active = sum(1 for c in self._clients.values() if c.in_flight or now - c.last_seen < ACTIVE_WINDOW)
+        return self.rate / max(active, 1)
+
+    @staticmethod
+    def _reject(reason: str, retry_after: float, detail: str) -> HTTPException:
+        metrics.increment("admission_rejected_total", reason=reason)
+        return HTTPException(429, detail, headers={"Retry-After": str(max(math.ceil(retry_after), 1))})
+
+    def admit(self, client: str, cost: float) -> None:
+        """
+        Admit a device request of a client, or raise 429.
+
+        Every admitted request must be matched by a call to release().
+
+        :param self: AdmissionController instance
+        :param client: Client identity (API key or IP address)
+        :type client: str
+        :param cost: Estimated device commands of the request
+        :type cost: float
+        """
+        now = time.monotonic()
+        with self._lock:
+            budget = self._clients.get(client)
+            if budget is None:
+                budget = self._clients[client] = ClientBudget(tokens=self.burst, refilled=now, last_seen=now)
+                self._clients = {k: v for k, v in self._clients.items()
+                                 if v.in_flight or now - v.last_seen < ACTIVE_WINDOW or k == client}
+            share = self._share(now)
+            budget.tokens = min(self.burst, budget.tokens + (now - budget.refilled) * share)
+            budget.refilled = budget.last_seen = now
+            if budget.in_flight >= self.max_queue:
+                raise self._reject("client_queue", 1, "Too many concurrent device requests from this client")
+            if self._in_flight >= self.max_total:
+                raise self._reject("total_queue", 1, "Too many concurrent device requests")
+            needed = min(cost, self.burst)
+            if budget.tokens < needed:
+                raise self._reject("rate", (needed - budget.tokens) / share,
+                                   "Device command budget exceeded for this client")
+            budget.tokens -= cost
+            budget.in_flight += 1
+            self._in_flight += 1
+
+    def release(self, client: str) -> None:
+        with self._lock:
+            budget = self._clients.get(client)
+            if budget is not None:
+                budget.in_flight -= 1
+                budget.last_seen = time.monotonic()
+            self._in_flight -= 1
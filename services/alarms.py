@@ -0,0 +1,123 @@
+import urllib.request
+from queue import Queue, Full
+from threading import Lock, Thread
+
+import numpy as np
+
+from constants.status import STATUS_BITS
+from schemas.alarm import AlarmEvent, AlarmThresholds
+from services.events import EventHub
+from services.sampler import CHANNELS, Sample
+
+LIMIT_KINDS = ["high", "low", "rate_of_change"]
+KINDS = LIMIT_KINDS + list(STATUS_BITS)
+FLAG_BITS = np.array(list(STATUS_BITS.values()), dtype=np.uint8)
+
+
+class AlarmEngine:
+    """
+    Evaluates per-channel alarm thresholds against every sample, across all channels at once.
+
+    Only state changes are emitted: to the event hub under the ``alarm`` topic and,
+    if configured, to a webhook posted from a separate thread.
+    """
+
+    def __init__(self, hub: EventHub, webhook_url: str | None = None) -> None:
+        self.hub = hub
+        self._lock = Lock()
+        # Limits per channel; NaN disables the check
+        self._limits = np.full((CHANNELS, len(LIMIT_KINDS)), np.nan)
+        self._flags = np.zeros((CHANNELS, len(STATUS_BITS)), dtype=bool)
+        self._active = np.zeros((CHANNELS, len(KINDS)), dtype=bool)
+        self._events: dict[tuple[int, str], AlarmEvent] = {}
+        self._prev_time = np.full(CHANNELS, np.nan)
+        self._prev_kelvin = np.full(CHANNELS, np.nan)
+        self._webhook: Queue[str] | None = None
+        if webhook_url:
+            self._webhook = Queue(1024)
+            Thread(target=self._post_webhook, args=(webhook_url,),
+                   name="alarm-webhook", daemon=True).start()
+
+    def get_thresholds(self, channel: int) -> AlarmThresholds:
+        with self._lock:
+            high, low, rate = (None if np.isnan(v) else float(v) for v in self._limits[channel - 1])
+            flags = [name for name, on in zip(STATUS_BITS, self._flags[channel - 1]) if on]
+        return AlarmThresholds(high=high, low=low, rate_of_change=rate, status_flags=flags)
+
+    def set_thresholds(self, channel: int, thresholds: AlarmThresholds) -> None:
+        with self._lock:
+            self._limits[channel - 1] = [
+                np.nan if v is None else v
+                for v in (thresholds.high, thresholds.low, thresholds.rate_of_change)
+            ]
+            self._flags[channel - 1] = [name in thresholds.status_flags for name in STATUS_BITS]
+
+    def active(self) -> list[AlarmEvent]:
+        with self._lock:
+            return list(self._events.values())
+
+    def evaluate(self, sample: Sample) -> None:
+        """
+        Evaluate all thresholds against a sample and emit alarm state changes.
+
+        :param self: AlarmEngine instance
+        :param sample: Latest sample of every channel
+        :type sample: Sample
+        """
+        kelvin = sample.kelvin
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rate = np.where(
+                sample.updated,
+                np.abs((kelvin - self._prev_kelvin) / (sample.timestamps - self._prev_time)),
+                np.nan)
+        self._prev_kelvin = np.where(sample.updated, kelvin, self._prev_kelvin)
+        self._prev_time = np.where(sample.updated, sample.timestamps, self._prev_time)
+        values = np.column_stack([kelvin, kelvin, rate])
+
+        with self._lock:
+            high, low, max_rate = self._limits.T
+            with np.errstate(invalid="ignore"):
+                limits = np.column_stack([kelvin > high, kelvin < low, rate > max_rate])
+            flags = (sample.status[:, None] & FLAG_BITS) != 0
+            state = np.hstack([limits, flags & self._flags])
+            # Channels that were not re-read keep their previous state
+            state = np.where(sample.updated[:, None], state, self._active)
+            changed = np.argwhere(state != self._active)
+            self._active = state
+            events = []
+            for i, k in changed:
+                kind = KINDS[k]
+                limit = k < len(LIMIT_KINDS)
+                event = AlarmEvent(
+                    channel=int(i) + 1,
+                    kind=kind,
+                    active=bool(state[i, k]),
+                    value=float(values[i, k]) if limit else float(sample.status[i]),
+                    threshold=float(self._limits[i, k]) if limit else None,
+                    timestamp=float(sample.timestamps[i]),
+                )
+                if event.active:
+                    self._events[(event.channel, kind)] = event
+                else:
+                    self._events.pop((event.channel, kind), None)
+                events.append(event)
+
+        for event in events:
+            data = event.model_dump_json(by_alias=True)
+            self.hub.publish("alarm", data)
+            if self._webhook is not None:
+                try:
+                    self._webhook.put_nowait(data)
+                except Full:
+                    pass
+
+    def _post_webhook(self, url: str) -> None:
+        assert self._webhook is not None
+        while True:
+            data = self._webhook.get()
+            request = urllib.request.Request(
+                url, data=data.encode(), headers={"Content-Type": "application/json"})
+            try:
+                urllib.request.urlopen(request, timeout=5).close()
+            except Exception as e:
+                print(f"Alarm webhook failed: {e}")
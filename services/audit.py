@@ -0,0 +1,236 @@
+import hashlib
+import os
+import time
+from queue import Empty, Full, Queue
+from threading import Condition, Event, Lock, Thread
+from typing import Any, TextIO, get_args
+
+from fastapi import Request
+
+from schemas.audit import AuditEntry, FsyncPolicy
+from services.metrics import metrics
+
+# Most entries written to disk in one batch
+MAX_BATCH = 1000
+
+# Seconds to wait before retrying a batch that could not be written
+RETRY_INTERVAL = 1.0
+
+
+def audit_client(request: Request) -> str:
+    """Identify the client making a request as admission control does, hashing its API key."""
+    client = request.app.state.admission.identify(request)
+    if client.startswith("key:"):
+        return f"key:{hashlib.sha256(client[4:].encode()).hexdigest()[:12]}"
+    return client
+
+
+class AuditJournal:
+    """
+    Append-only JSON Lines journal of configuration writes.
+
+    record() only puts the entry on an in-memory queue, so it can be called while the
+    device lock is held; a background thread serializes queued entries and appends them
+    in batches. ``fsync`` is ``none`` (leave it to the OS), ``batch`` (after each batch) or
+    ``always`` (after each entry). The file is rotated to ``<path>.1`` ... ``<path>.<backups>``
+    once it exceeds ``max_bytes``. A batch that cannot be written is kept and retried, so
+    entries are only lost when the queue overflows meanwhile; write failures and dropped
+    entries are counted in the ``audit_write_failed_total`` and ``audit_dropped_total``
+    metrics.
+    """
+
+    def __init__(self, path: str, fsync: FsyncPolicy = "batch", max_bytes: int = 10 * 1024 * 1024,
+                 backups: int = 5, max_queue: int = 10000) -> None:
+        if fsync not in get_args(FsyncPolicy):
+            raise ValueError(f"Invalid audit fsync policy {fsync!r}, expected one of {get_args(FsyncPolicy)}")
+        self.path = path
+        self.fsync = fsync
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._queue: Queue[tuple | None] = Queue(max_queue)
+        self._file_lock = Lock()
+        self._file: TextIO | None = None
+        self._written = Condition()
+        self._enqueued = 0
+        self._done = 0
+        self._thread: Thread | None = None
+        self._stopping = Event()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stopping.clear()
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._thread = Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Write out every queued entry and close the journal."""
+        if self._thread is not None:
+            self._stopping.set()  # Stop retrying failed batches
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        with self._file_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def record(self, request: Request, operation: str, channel: int | None,
+               before: Any, after: Any, error: str | None = None) -> None:
+        """
+        Queue a journal entry for a configuration write.
+
+        Values may be pydantic models; they are serialized by the writer thread.
+
+        :param self: AuditJournal instance
+        :param request: Request that made the write, to identify the client
+        :type request: Request
+        :param operation: operationId of the write
+        :type operation: str
+        :param channel: Channel written, if any
+        :type channel: int | None
+        :param before: Cached value before the write
+        :type before: Any
+        :param after: Value written
+        :type after: Any
+        :param error: Failure message, if the write failed
+        :type error: str | None
+        """
+        try:
+            self._queue.put_nowait((time.time(), audit_client(request), operation, channel, before, after, error))
+        except Full:
+            metrics.increment("audit_dropped_total")
+            return
+        with self._written:
+            self._enqueued += 1
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait until the entries queued so far are on disk."""
+        with self._written:
+            target = self._enqueued
+            self._written.wait_for(lambda: self._done >= target, timeout)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            entries = [entry for entry in batch if entry is not None]
+            stopping = len(entries) < len(batch)
+            lines = self._serialize(entries)
+            while True:
+                try:
+                    self._write(lines)
+                    break
+                except Exception as e:
+                    metrics.increment("audit_write_failed_total")
+                    print(f"Audit journal write failed: {e}")
+                    if stopping or self._stopping.is_set():
+                        metrics.increment("audit_dropped_total", len(lines))
+                        break
+                    time.sleep(RETRY_INTERVAL)
+            with self._written:
+                self._done += len(entries)
+                self._written.notify_all()
+            if stopping:
+                return
+
+    @staticmethod
+    def _serialize(entries: list[tuple]) -> list[str]:
+        lines = []
+        for timestamp, client, operation, channel, before, after, error in entries:
+            try:
+                lines.append(AuditEntry(
+                    timestamp=timestamp, client=client, operation=operation, channel=channel,
+                    before=before, after=after, error=error).model_dump_json(by_alias=True) + "\n")
+            except Exception as e:
+                metrics.increment("audit_dropped_total")
+                print(f"Audit entry for {operation} could not be serialized: {e}")
+        return lines
+
+    def _write(self, lines: list[str]) -> None:
+        with self._file_lock:
+            if self._file is None or self._file.closed:
+                self._file = open(self.path, "a", encoding="utf-8")
+            for line in lines:
+                self._file.write(line)
+                if self.fsync == "always":
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+            self._file.flush()
+            if self.fsync == "batch":
+                os.fsync(self._file.fileno())
+            if self.max_bytes and self._file.tell() >= self.max_bytes:
+                try:
+                    self._rotate()
+                except OSError as e:
+                    # The batch is on disk; the file is reopened (or rotated) on the next write
+                    metrics.increment("audit_write_failed_total")
+                    print(f"Audit journal rotation failed: {e}")
+
+    def _rotate(self) -> None:
+        assert self._file is not None
+        self._file.close()
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def query(self, start: float | None = None, end: float | None = None, client: str | None = None,
+              operation: str | None = None, limit: int = 1000) -> list[AuditEntry]:
+        """
+        Return journal entries in a time range, oldest first.
+
+        Entries still queued when the query arrives are written out first.
+
+        :param self: AuditJournal instance
+        :param start: Earliest timestamp (Unix seconds)
+        :type start: float | None
+        :param end: Latest timestamp (Unix seconds)
+        :type end: float | None
+        :param client: Only entries of this client
+        :type client: str | None
+        :param operation: Only entries of this operationId
+        :type operation: str | None
+        :param limit: Return at most the latest ``limit`` matching entries
+        :type limit: int
+        :return: Matching entries
+        :rtype: list[AuditEntry]
+        """
+        self.flush()
+        paths = [f"{self.path}.{i}" for i in range(self.backups, 0, -1)] + [self.path]
+        # Open the files under the lock so a rotation cannot move them mid-query, then read
+        # them without it so the writer is not held up
+        with self._file_lock:
+            files = [open(path, encoding="utf-8") for path in paths if os.path.exists(path)]
+        entries = []
+        try:
+            for f in files:
+                # A rotated file was last written after its newest entry, so it can be skipped
+                # when that is before start
+                if start is not None and f is not files[-1] and os.fstat(f.fileno()).st_mtime < start:
+                    continue
+                for number, line in enumerate(f):
+                    try:
+                        entry = AuditEntry.model_validate_json(line)
+                    except ValueError:
+                        continue  # Truncated by a crash, or still being written
+                    if number == 0 and end is not None and entry.timestamp > end:
+                        return entries[-limit:]  # This file and any newer ones are after end
+                    if ((start is None or entry.timestamp >= start)
+                            and (end is None or entry.timestamp <= end)
+                            and (client is None or entry.client == client)
+                            and (operation is None or entry.operation == operation)):
+                        entries.append(entry)
+        finally:
+            for f in files:
+                f.close()
+        return entries[-limit:]
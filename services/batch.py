@@ -0,0 +1,140 @@
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from constants.timeouts import BATCH_TIMEOUT
+from exceptions.lakeshore import DeadlineExceededError, LakeshoreError
+from schemas.batch import BatchOperation, BatchRequest, BatchResp, BatchResult
+from schemas.curve import CurveDataPoint, CurveHeader
+from schemas.reading import InputParameter
+from services.lakeshore import LakeshoreService
+
+
+_BOOL = TypeAdapter(bool)
+
+
+def _param(op: BatchOperation, name: str, low: int | None = None, high: int | None = None) -> int:
+    try:
+        value = int(op.params[name])
+    except KeyError:
+        raise HTTPException(400, f"{op.operation_id} requires parameter '{name}'")
+    except (TypeError, ValueError):
+        raise HTTPException(400, f"{op.operation_id} parameter '{name}' must be an integer")
+    if (low is not None and value < low) or (high is not None and value > high):
+        raise HTTPException(400, f"{op.operation_id} parameter '{name}' must be between {low} and {high}")
+    return value
+
+
+def _str_param(op: BatchOperation, name: str) -> str:
+    if name not in op.params:
+        raise HTTPException(400, f"{op.operation_id} requires parameter '{name}'")
+    return str(op.params[name])
+
+
+def _bool_param(op: BatchOperation, name: str, default: bool = False) -> bool:
+    # Parsed like a boolean query parameter, so "false" and "0" are False
+    try:
+        return _BOOL.validate_python(op.params.get(name, default))
+    except ValidationError:
+        raise HTTPException(400, f"{op.operation_id} parameter '{name}' must be a boolean")
+
+
+def _body[M: BaseModel](op: BatchOperation, model: type[M]) -> M:
+    try:
+        return model.model_validate(op.body)
+    except ValidationError as e:
+        raise HTTPException(400, f"{op.operation_id} body is invalid: {e.errors()}")
+
+
+def _channel(op: BatchOperation) -> int:
+    return _param(op, "channel", 1, 8)
+
+
+def _index(op: BatchOperation) -> int:
+    return _param(op, "index", 1, 200)
+
+
+Handler = Callable[[LakeshoreService, Request, BatchOperation], Any]
+
+# Device-bound operations, keyed by the operation_id of the equivalent endpoint
+OPERATIONS: dict[str, Handler] = {
+    "getIdentification": lambda ls, r, op: ls.get_identification(r),
+    "getStatus": lambda ls, r, op: ls.get_status(r, _channel(op)),
+    "getAllStatus": lambda ls, r, op: ls.get_all_status(r, _bool_param(op, "compact")),
+    "getModuleName": lambda ls, r, op: ls.get_modname(r),
+    "setModuleName": lambda ls, r, op: ls.set_modname(r, _str_param(op, "name")),
+    "getBrightness": lambda ls, r, op: ls.get_brightness(r),
+    "setBrightness": lambda ls, r, op: ls.set_brightness(r, _param(op, "brightness", 0, 100)),
+    "getInputParameter": lambda ls, r, op: ls.get_input_parameter(r, _channel(op)),
+    "setInputParameter": lambda ls, r, op: ls.set_input_config(r, _body(op, InputParameter), _channel(op)),
+    "getMonitor": lambda ls, r, op: ls.get_monitor(r, _channel(op)).model_dump(by_alias=True, exclude_none=True),
+    "getCurveHeader": lambda ls, r, op: ls.get_curve_header(r, _channel(op)),
+    "setCurveHeader": lambda ls, r, op: ls.set_curve_header(r, _body(op, CurveHeader), _channel(op)),
+    "getCurveDataPoint": lambda ls, r, op: ls.get_curve_data_point(r, _channel(op), _index(op)),
+    "getAllCurveDataPoints": lambda ls, r, op: ls.get_curve_data_points(r, _channel(op)),
+    "setCurveDataPoint": lambda ls, r, op: ls.set_curve_data_point(r, _body(op, CurveDataPoint), _channel(op), _index(op)),
+    "deleteCurve": lambda ls, r, op: ls.delete_curve(r, _channel(op)),
+    "setFactoryDefaults": lambda ls, r, op: ls.set_factory_defaults(r),
+}
+
+
+def run_operation(ls: LakeshoreService, request: Request, op: BatchOperation) -> Any:
+    """
+    Run a single operation by operation_id and return its JSON-encodable result.
+
+    :param ls: LakeshoreService instance
+    :type ls: LakeshoreService
+    :param request: FastAPI request object
+    :type request: Request
+    :param op: Operation to run
+    :type op: BatchOperation
+    :return: Result of the operation, encoded as the endpoint would return it
+    :rtype: Any
+    """
+    handler = OPERATIONS.get(op.operation_id)
+    if handler is None:
+        raise HTTPException(400, f"Unsupported operation '{op.operation_id}'")
+    return jsonable_encoder(handler(ls, request, op), by_alias=True)
+
+
+def run_batch(ls: LakeshoreService, request: Request, batch: BatchRequest) -> BatchResp:
+    """
+    Run an ordered list of operations under a single hold of the device lock.
+
+    Other clients cannot interleave between the steps. Execution stops at the first
+    failing operation.
+
+    :param ls: LakeshoreService instance
+    :type ls: LakeshoreService
+    :param request: FastAPI request object
+    :type request: Request
+    :param batch: Operations to run
+    :type batch: BatchRequest
+    :return: Per-operation results in request order
+    :rtype: BatchResp
+    """
+    unknown = [op.operation_id for op in batch.operations if op.operation_id not in OPERATIONS]
+    if unknown:
+        raise HTTPException(400, f"Unsupported operations: {', '.join(unknown)}")
+
+    results: list[BatchResult] = []
+    with ls._session(request, BATCH_TIMEOUT):
+        for op in batch.operations:
+            try:
+                results.append(BatchResult(
+                    operation_id=op.operation_id, is_success=True, result=run_operation(ls, request, op)))
+            except HTTPException as e:
+                results.append(BatchResult(operation_id=op.operation_id, is_success=False, error=str(e.detail)))
+                break
+            except DeadlineExceededError:
+                raise  # The whole batch has run out of time: 504, as for a single request
+            except LakeshoreError as e:
+                results.append(BatchResult(operation_id=op.operation_id, is_success=False, error=e.message))
+                break
+    completed = sum(r.is_success for r in results)
+    results += [BatchResult(operation_id=op.operation_id, is_success=False, error="Not run")
+                for op in batch.operations[len(results):]]
+    return BatchResp(completed=completed, results=results)
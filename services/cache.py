@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+
+from schemas.curve import CurveHeader, CurveDataPoints
+from schemas.device import IdentificationResp
+from schemas.reading import InputParameter
+
+
+@dataclass
+class DeviceCache:
+    """
+    Last known device configuration, filled at startup and kept current by API writes.
+
+    Entries are only read and written while the device lock is held. Settings changed on
+    the instrument's front panel are not seen until the cache is cleared (reconnect or
+    factory reset). ``ready`` records that the startup prefill pass has completed.
+    """
+
+    identification: IdentificationResp | None = None
+    modname: str | None = None
+    brightness: int | None = None
+    input_parameters: dict[int, InputParameter] = field(default_factory=dict)
+    curve_headers: dict[int, CurveHeader] = field(default_factory=dict)
+    curves: dict[int, CurveDataPoints] = field(default_factory=dict)
+    ready: bool = False
+    error: str | None = None
+    generation: int = 0
+    curve_versions: dict[int, int] = field(default_factory=dict)
+
+    def curve_written(self, channel: int) -> None:
+        """Note a write to a channel's curve, so curve reads started before it are not cached."""
+        self.curve_versions[channel] = self.curve_versions.get(channel, 0) + 1
+
+    def curve_version(self, channel: int) -> tuple[int, int]:
+        return self.generation, self.curve_versions.get(channel, 0)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self.identification = None
+        self.modname = None
+        self.brightness = None
+        self.input_parameters.clear()
+        self.curve_headers.clear()
+        self.curves.clear()
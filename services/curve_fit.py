@@ -0,0 +1,106 @@
+import numpy as np
+from fastapi import HTTPException
+from lakeshore.model_240_enums import Model240Enums
+
+from schemas.curve import CurveDataPoints, CurveFitRequest, CurveFitResp
+
+CURVE_POINTS = 200
+
+# Degree of the Chebyshev model used for breakpoint placement and denoising
+MODEL_DEGREE = 15
+
+
+def _monotone(y: np.ndarray) -> np.ndarray:
+    """Closest-envelope non-decreasing version of y: mean of the running max and reversed running min."""
+    return (np.maximum.accumulate(y) + np.minimum.accumulate(y[::-1])[::-1]) / 2
+
+
+def _breakpoints(x: np.ndarray, model: np.polynomial.Chebyshev, count: int) -> np.ndarray:
+    """
+    Place breakpoints to minimise the max error of linear interpolation.
+
+    For piecewise-linear interpolation the max error on an interval scales with
+    h^2 |f''|, so breakpoints are spaced with density proportional to |f''|^(1/2),
+    taken from a smooth model of the data. A uniform floor keeps flat regions covered.
+    """
+    grid = np.linspace(x[0], x[-1], 20 * count)
+    density = np.sqrt(np.abs(model.deriv(2)(grid)))
+    density += 0.1 * density.mean() + 1e-12
+    cumulative = np.concatenate(([0.0], np.cumsum((density[1:] + density[:-1]) / 2 * np.diff(grid))))
+    return np.interp(np.linspace(0, cumulative[-1], count), cumulative, grid)
+
+
+def fit_curve(request: CurveFitRequest) -> CurveFitResp:
+    """
+    Fit raw (sensor, temperature) calibration samples into a 200-point Model240 curve.
+
+    Samples are sorted and averaged per sensor value, made monotonic in the direction
+    given by the header's coefficient, then resampled at breakpoints placed where the
+    curve bends most. The result is validated against the header's temperature limit
+    and coefficient.
+
+    :param request: Calibration samples and target header
+    :type request: CurveFitRequest
+    :return: Fitted curve with error and validation report
+    :rtype: CurveFitResp
+    """
+    sensors = np.asarray(request.sensors, dtype=np.float64)
+    temperatures = np.asarray(request.temperatures, dtype=np.float64)
+    if sensors.shape != temperatures.shape:
+        raise HTTPException(400, "sensors and temperatures must have the same length")
+    finite = np.isfinite(sensors) & np.isfinite(temperatures)
+    sensors, temperatures = sensors[finite], temperatures[finite]
+
+    # Sort by sensor value and average repeated measurements
+    x, inverse, counts = np.unique(sensors, return_inverse=True, return_counts=True)
+    if len(x) < 2:
+        raise HTTPException(400, "At least two distinct sensor values are required")
+    y = np.bincount(inverse, weights=temperatures) / counts
+
+    errors, warnings = [], []
+    # Negative coefficient: temperature falls as the sensor value rises
+    decreasing = request.header.coefficient == Model240Enums.Coefficients.NEGATIVE
+    trend = np.polyfit(x, y, 1)[0]
+    if (trend < 0) != decreasing:
+        errors.append(f"Samples trend {'down' if trend < 0 else 'up'} with sensor value, "
+                      f"which contradicts the {request.header.coefficient.name.lower()} coefficient")
+    sign = -1.0 if decreasing else 1.0
+    fitted = sign * _monotone(sign * y)
+
+    model = np.polynomial.Chebyshev.fit(x, fitted, min(MODEL_DEGREE, len(x) - 1))
+    knots_x = _breakpoints(x, model, CURVE_POINTS)
+    # Take breakpoint temperatures from the smooth model when it explains the data down to
+    # the measurement noise (estimated from neighbouring samples), else from the data itself
+    second = np.diff(y, 2)
+    noise = 1.4826 * np.median(np.abs(second - np.median(second))) / np.sqrt(6) if len(y) > 2 else 0.0
+    if np.sqrt(np.mean((model(x) - fitted) ** 2)) <= 1.2 * noise:
+        knots_y = sign * _monotone(sign * model(knots_x))
+    else:
+        knots_y = np.interp(knots_x, x, fitted)
+    if len(x) < CURVE_POINTS:
+        warnings.append(f"Only {len(x)} distinct sensor values; breakpoints are interpolated between them")
+
+    error = np.interp(x, knots_x, knots_y) - fitted
+    residual = np.interp(sensors, knots_x, knots_y) - temperatures
+
+    if knots_y.max() > request.header.temperature_limit:
+        errors.append(f"Curve reaches {knots_y.max():.3f} K, above the temperature limit "
+                      f"of {request.header.temperature_limit} K")
+    if knots_y.min() <= 0:
+        errors.append("Curve contains non-positive temperatures")
+    if len(np.unique(knots_x)) < CURVE_POINTS:
+        errors.append("Breakpoints are not strictly increasing in sensor value")
+
+    return CurveFitResp(
+        curve=CurveDataPoints(
+            channel=request.channel,
+            temperatures=knots_y.tolist(),
+            sensors=knots_x.tolist()
+        ),
+        valid=not errors,
+        max_error=float(np.abs(error).max()),
+        rms_error=float(np.sqrt(np.mean(error ** 2))),
+        residual_rms=float(np.sqrt(np.mean(residual ** 2))),
+        errors=errors,
+        warnings=warnings
+    )
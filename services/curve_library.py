@@ -0,0 +1,99 @@
+import json
+import os
+import uuid
+from collections import defaultdict
+from threading import Lock
+
+import numpy as np
+from fastapi import HTTPException
+
+from schemas.curve import CurveHeader, LibraryCurve, LibraryCurveEntry
+
+INDEX_FILE = "index.json"
+
+
+class CurveLibrary:
+    """
+    Persistent store of calibration curves, indexed by sensor serial number and curve name.
+
+    Each curve's points are kept in a compressed ``<curve_id>.npz`` file; headers live in a
+    single JSON index that is loaded at startup, so listing and lookups never touch the
+    point files.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self._lock = Lock()
+        self._headers: dict[str, CurveHeader] = {}
+        self._by_serial: defaultdict[str, set[str]] = defaultdict(set)
+        self._by_name: defaultdict[str, set[str]] = defaultdict(set)
+        os.makedirs(directory, exist_ok=True)
+        index = os.path.join(directory, INDEX_FILE)
+        if os.path.exists(index):
+            with open(index) as f:
+                for curve_id, header in json.load(f).items():
+                    self._add_to_index(curve_id, CurveHeader.model_validate(header))
+
+    def _add_to_index(self, curve_id: str, header: CurveHeader) -> None:
+        self._headers[curve_id] = header
+        self._by_serial[header.serial_number].add(curve_id)
+        self._by_name[header.curve_name].add(curve_id)
+
+    def _write_index(self) -> None:
+        path = os.path.join(self.directory, INDEX_FILE)
+        with open(path + ".tmp", "w") as f:
+            json.dump({k: v.model_dump(mode="json") for k, v in self._headers.items()}, f)
+        os.replace(path + ".tmp", path)
+
+    def list(self, serial_number: str | None = None, curve_name: str | None = None) -> list[LibraryCurveEntry]:
+        """
+        List stored curves, optionally filtered by sensor serial number and/or curve name.
+
+        :param self: CurveLibrary instance
+        :param serial_number: Exact sensor serial number to match
+        :type serial_number: str | None
+        :param curve_name: Exact curve name to match
+        :type curve_name: str | None
+        :return: Matching index entries
+        :rtype: list[LibraryCurveEntry]
+        """
+        with self._lock:
+            ids = set(self._headers)
+            if serial_number is not None:
+                ids &= self._by_serial.get(serial_number, set())
+            if curve_name is not None:
+                ids &= self._by_name.get(curve_name, set())
+            return [LibraryCurveEntry(curve_id=i, header=self._headers[i]) for i in sorted(ids)]
+
+    def get(self, curve_id: str) -> LibraryCurve:
+        with self._lock:
+            header = self._headers.get(curve_id)
+        if header is None:
+            raise HTTPException(404, f"Curve {curve_id} not found in library")
+        with np.load(os.path.join(self.directory, f"{curve_id}.npz")) as data:
+            return LibraryCurve(
+                header=header,
+                temperatures=data["temperatures"].tolist(),
+                sensors=data["sensors"].tolist()
+            )
+
+    def add(self, curve: LibraryCurve) -> LibraryCurveEntry:
+        curve_id = uuid.uuid4().hex
+        np.savez_compressed(
+            os.path.join(self.directory, f"{curve_id}.npz"),
+            temperatures=np.asarray(curve.temperatures, dtype=np.float64),
+            sensors=np.asarray(curve.sensors, dtype=np.float64))
+        with self._lock:
+            self._add_to_index(curve_id, curve.header)
+            self._write_index()
+        return LibraryCurveEntry(curve_id=curve_id, header=curve.header)
+
+    def delete(self, curve_id: str) -> None:
+        with self._lock:
+            header = self._headers.pop(curve_id, None)
+            if header is None:
+                raise HTTPException(404, f"Curve {curve_id} not found in library")
+            self._by_serial[header.serial_number].discard(curve_id)
+            self._by_name[header.curve_name].discard(curve_id)
+            self._write_index()
+        os.remove(os.path.join(self.directory, f"{curve_id}.npz"))
@@ -0,0 +1,65 @@
+import math
+import time
+
+from fastapi import Request
+
+from constants.timeouts import TIMEOUT_HEADER, MAX_TIMEOUT
+from exceptions.lakeshore import DeadlineExceededError
+
+
+class Deadline:
+    """Absolute point in time after which a request sends no further device commands."""
+
+    def __init__(self, timeout: float, start: float | None = None) -> None:
+        self.timeout = timeout
+        self.expires_at = (start if start is not None else time.monotonic()) + timeout
+
+    @classmethod
+    def from_request(cls, request: Request, default: float) -> "Deadline":
+        """
+        Build a deadline from the client's timeout header, or the endpoint default.
+
+        The deadline is measured from when the request was received, so time spent
+        queued in the threadpool counts against it.
+
+        :param request: FastAPI request object
+        :type request: Request
+        :param default: Endpoint default timeout in seconds
+        :type default: float
+        :return: Deadline for this request
+        :rtype: Deadline
+        """
+        timeout = default
+        header = request.headers.get(TIMEOUT_HEADER)
+        if header:
+            try:
+                requested = float(header)
+            except ValueError:
+                requested = math.nan
+            if math.isfinite(requested):
+                timeout = min(max(requested, 0.0), MAX_TIMEOUT)
+        return cls(timeout, getattr(request.state, "received_at", None))
+
+    def remaining(self) -> float:
+        """
+        Seconds left before the deadline, never negative.
+
+        :param self: Deadline instance
+        :return: Remaining time in seconds
+        :rtype: float
+        """
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self, stage: str = "device") -> None:
+        """
+        Raise if the deadline has passed.
+
+        :param self: Deadline instance
+        :param stage: What the request was waiting for, reported in the error
+        :type stage: str
+        """
+        if self.expired():
+            raise DeadlineExceededError(stage)
@@ -0,0 +1,97 @@
+import asyncio
+from contextlib import asynccontextmanager
+from collections.abc import AsyncGenerator, Callable
+from threading import Lock
+
+
+class EventHub:
+    """
+    Fan-out of server-side events to streaming subscribers.
+
+    Events are published from background threads (e.g. the reading sampler) and
+    delivered to each subscriber's asyncio queue on its own event loop. A slow
+    subscriber whose queue is full misses events instead of blocking the publisher.
+    """
+
+    def __init__(self, max_queue: int = 256) -> None:
+        self.max_queue = max_queue
+        self._subscribers: list[tuple[asyncio.AbstractEventLoop,
+                                      asyncio.Queue[tuple[str, str]], frozenset[str]]] = []
+        self._lock = Lock()
+
+    def has_subscribers(self, topic: str) -> bool:
+        with self._lock:
+            return any(topic in topics for _, _, topics in self._subscribers)
+
+    def publish(self, topic: str, data: str) -> None:
+        """
+        Publish an event to every subscriber of the topic. Safe to call from any thread.
+
+        :param self: EventHub instance
+        :param topic: Event topic, sent as the SSE event name
+        :type topic: str
+        :param data: JSON-encoded event payload
+        :type data: str
+        """
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue, topics in subscribers:
+            if topic in topics:
+                loop.call_soon_threadsafe(self._put, queue, (topic, data))
+
+    @staticmethod
+    def _put(queue: asyncio.Queue[tuple[str, str]], event: tuple[str, str]) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            pass
+
+    @asynccontextmanager
+    async def subscribe(self, *topics: str) -> AsyncGenerator[asyncio.Queue[tuple[str, str]], None]:
+        """
+        Subscribe to one or more topics for the lifetime of the context.
+
+        :param self: EventHub instance
+        :param topics: Topics to receive
+        :type topics: str
+        :return: Queue receiving (topic, data) tuples
+        :rtype: AsyncGenerator[asyncio.Queue[tuple[str, str]], None]
+        """
+        queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(self.max_queue)
+        entry = (asyncio.get_running_loop(), queue, frozenset(topics))
+        with self._lock:
+            self._subscribers.append(entry)
+        try:
+            yield queue
+        finally:
+            with self._lock:
+                self._subscribers.remove(entry)
+
+
+async def sse_stream(hub: EventHub, is_disconnected, *topics: str, keepalive: float = 15.0,
+                     transform: Callable[[str, str], str] | None = None) -> AsyncGenerator[str, None]:
+    """
+    Render subscribed events as a Server-Sent Events byte stream.
+
+    :param hub: Event hub to subscribe to
+    :type hub: EventHub
+    :param is_disconnected: Coroutine function reporting client disconnect
+    :param topics: Topics to stream
+    :type topics: str
+    :param keepalive: Seconds between keep-alive comments when idle
+    :type keepalive: float
+    :param transform: Rewrites each event's data for this subscriber, given (topic, data)
+    :type transform: Callable[[str, str], str] | None
+    :return: SSE-formatted chunks
+    :rtype: AsyncGenerator[str, None]
+    """
+    async with hub.subscribe(*topics) as queue:
+        while not await is_disconnected():
+            try:
+                topic, data = await asyncio.wait_for(queue.get(), keepalive)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if transform is not None:
+                data = transform(topic, data)
+            yield f"event: {topic}\ndata: {data}\n\n"
@@ -0,0 +1,154 @@
+from threading import Lock
+
+import numpy as np
+from fastapi import HTTPException
+
+from schemas.reading import HistoryResp, HistorySeries, ResampleMethod, TemperatureUnit
+from services.sampler import CHANNELS, Sample
+from services.units import DEFAULT_UNITS, convert, needs_kelvin
+
+# Upper bound on the rows of one history table
+MAX_POINTS = 100_000
+
+
+def resample(t: np.ndarray, values: np.ndarray, grid: np.ndarray, method: ResampleMethod) -> np.ndarray:
+    """
+    Resample a time series onto a time grid.
+
+    ``linear`` interpolates between the surrounding samples; ``previous`` carries the last
+    sample at or before each grid time forward. Grid times before the first sample (and,
+    for ``linear``, after the last) are NaN.
+
+    :param t: Sample times, ascending
+    :type t: np.ndarray
+    :param values: Sample values
+    :type values: np.ndarray
+    :param grid: Target times
+    :type grid: np.ndarray
+    :param method: Resampling method
+    :type method: ResampleMethod
+    :return: Values at the grid times
+    :rtype: np.ndarray
+    """
+    if len(t) == 0:
+        return np.full(len(grid), np.nan)
+    if method == "linear":
+        return np.interp(grid, t, values, left=np.nan, right=np.nan)
+    index = np.searchsorted(t, grid, side="right") - 1
+    return np.where(index >= 0, values[np.maximum(index, 0)], np.nan)
+
+
+def _column(values: np.ndarray) -> list[float | None]:
+    column = values.astype(object)
+    column[np.isnan(values)] = None
+    return column.tolist()
+
+
+class ReadingHistory:
+    """
+    Fixed-size per-channel ring buffers of sampled readings, fed by the reading sampler.
+
+    Each channel keeps its last ``capacity`` readings with the time they were taken, so
+    channels sampled at different rates keep histories of different lengths.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._lock = Lock()
+        self._timestamps = np.zeros((CHANNELS, capacity))
+        self._kelvin = np.zeros((CHANNELS, capacity))
+        self._sensor = np.zeros((CHANNELS, capacity))
+        self._head = np.zeros(CHANNELS, dtype=np.int64)
+        self._count = np.zeros(CHANNELS, dtype=np.int64)
+
+    def update(self, sample: Sample) -> None:
+        """
+        Append the channels refreshed by a sampler pass.
+
+        :param self: ReadingHistory instance
+        :param sample: Latest sample of every channel
+        :type sample: Sample
+        """
+        updated = sample.updated.nonzero()[0]
+        with self._lock:
+            head = self._head[updated]
+            self._timestamps[updated, head] = sample.timestamps[updated]
+            self._kelvin[updated, head] = sample.kelvin[updated]
+            self._sensor[updated, head] = sample.sensor[updated]
+            self._head[updated] = (head + 1) % self.capacity
+            self._count[updated] = np.minimum(self._count[updated] + 1, self.capacity)
+
+    def series(self, channel: int, start: float | None = None,
+               end: float | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return a channel's stored readings between two times, oldest first.
+
+        :param self: ReadingHistory instance
+        :param channel: Channel number
+        :type channel: int
+        :param start: Earliest wall-clock time to include
+        :type start: float | None
+        :param end: Latest wall-clock time to include
+        :type end: float | None
+        :return: Timestamps, kelvin and sensor readings
+        :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+        i = channel - 1
+        with self._lock:
+            count = int(self._count[i])
+            order = (self._head[i] - count + np.arange(count)) % self.capacity
+            t, kelvin, sensor = self._timestamps[i, order], self._kelvin[i, order], self._sensor[i, order]
+        lo = 0 if start is None else np.searchsorted(t, start, side="left")
+        hi = count if end is None else np.searchsorted(t, end, side="right")
+        return t[lo:hi], kelvin[lo:hi], sensor[lo:hi]
+
+    def query(self, channels: list[int], start: float | None = None, end: float | None = None,
+              step: float | None = None, method: ResampleMethod = "linear",
+              units: list[TemperatureUnit] | None = None) -> HistoryResp:
+        """
+        Return the history of several channels resampled onto one common time grid.
+
+        With ``step`` the grid is evenly spaced from ``start`` (or the earliest reading) to
+        ``end`` (or the latest); without it, the grid is the union of all sample times,
+        keeping every k-th one if there are more than ``MAX_POINTS``.
+
+        :param self: ReadingHistory instance
+        :param channels: Channel numbers
+        :type channels: list[int]
+        :param start: Earliest wall-clock time to include
+        :type start: float | None
+        :param end: Latest wall-clock time to include
+        :type end: float | None
+        :param step: Grid spacing in seconds
+        :type step: float | None
+        :param method: Resampling method
+        :type method: ResampleMethod
+        :param units: Units to return, or None for kelvin and sensor
+        :type units: list[TemperatureUnit] | None
+        :return: Column-oriented table keyed by the grid timestamps
+        :rtype: HistoryResp
+        """
+        data = {channel: self.series(channel, start, end) for channel in channels}
+        times = np.concatenate([t for t, _, _ in data.values()])
+        if len(times) == 0:
+            grid = np.empty(0)
+        elif step is None:
+            grid = np.unique(times)
+            # Thin out the union of every channel's sample times rather than refuse the default query
+            grid = grid[::-(-len(grid) // MAX_POINTS)]
+        else:
+            first = start if start is not None else times.min()
+            last = end if end is not None else times.max()
+            if (last - first) / step >= MAX_POINTS:
+                raise HTTPException(400, f"History query would return more than {MAX_POINTS} rows; increase step")
+            grid = first + step * np.arange(int((last - first) // step) + 1)
+        units = units or list(DEFAULT_UNITS)
+        series = []
+        for channel, (t, kelvin, sensor) in data.items():
+            columns = convert(
+                resample(t, kelvin, grid, method) if needs_kelvin(units) else None,
+                resample(t, sensor, grid, method) if "S" in units else None,
+                units)
+            series.append(HistorySeries(channel=channel, **{
+                field: _column(values) for field, values in columns.items()}))
+        return HistoryResp(method=method, timestamps=grid.tolist(), series=series)
@@ -1,26 +1,50 @@
-from contextlib import asynccontextmanager
-from threading import Lock
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from threading import Lock, RLock, Thread
 from fastapi import FastAPI
 from lakeshore import Model240, Model240InputParameter, Model240CurveHeader
 import os
+import time
 
-from constants.env import USE_MOCK
-from mocks.model240 import MockModel240
+from constants.env import USE_MOCK, SAMPLE_INTERVAL, ALARM_WEBHOOK_URL, DEVICE_COMMAND_BUDGET, CURVE_LIBRARY_DIR
+from constants.env import HISTORY_CAPACITY, ADMISSION_RATE, ADMISSION_BURST, ADMISSION_MAX_QUEUE, API_KEYS
+from constants.env import AUDIT_PATH, AUDIT_FSYNC, AUDIT_MAX_BYTES, AUDIT_BACKUPS
 
-from typing import Self
-from collections.abc import AsyncGenerator
+from typing import Any, Self
+from collections.abc import AsyncGenerator, Callable, Iterator
 from schemas.curve import CurveDataPoint, CurveHeader
-from schemas.curve import CurveDataPoints
-from exceptions.lakeshore import DeviceNotConnectedError, ChannelError
-from schemas.reading import InputParameter, MonitorResp
-from schemas.device import IdentificationResp, StatusResp, Brightness
+from schemas.curve import CurveDataPoints, LibraryCurve
+from exceptions.lakeshore import DeviceNotConnectedError, ChannelError, DeadlineExceededError
+from constants.timeouts import DEFAULT_TIMEOUT, CURVE_TIMEOUT, CONFIG_TIMEOUT, BURST_TIMEOUT
+from services.deadline import Deadline
+from services.events import EventHub
+from services.sampler import ReadingSampler, status_bits, publish_readings
+from services.alarms import AlarmEngine
+from services.statistics import StatisticsEngine
+from services.history import ReadingHistory
+from services.admission import AdmissionController
+from services.audit import AuditJournal
+from services.profiling import tracer
+from services.cache import DeviceCache
+from services.curve_library import CurveLibrary
+from services.units import UNIT_FIELDS, DEFAULT_UNITS, convert, needs_kelvin
+from schemas.reading import InputParameter, MonitorResp, SamplingConfig, SamplingStatus
+from schemas.reading import BurstResp, BurstStats, ChannelBurst, TemperatureUnit
+from schemas.device import IdentificationResp, StatusResp, AllStatusResp, Brightness
+from schemas.config import CONFIG_VERSION, ChannelConfig, DeviceConfig, ConfigApplyResult
+from constants.status import STATUS_BITS
+import numpy as np
 
 from fastapi import Request, HTTPException
 
+# A pending device write: description, write function, cached value before and value after
+Change = tuple[str, Callable[[], None], Any, Any]
+
 
 class LakeshoreService:
     """Service layer for interacting with the Lakeshore Model240 device."""
     device: Model240 | None = None
+    cache: DeviceCache = DeviceCache()
+    _prefilling = Lock()
 
     def __new__(cls) -> Self:
         """
@@ -46,6 +70,8 @@ class LakeshoreService:
         try:
             if LakeshoreService.device is None:
                 if os.getenv(USE_MOCK):
+                    # Imported lazily so production never loads mock-only modules
+                    from mocks.model240 import MockModel240
                     print("Using MockModel240")
                     LakeshoreService.device = MockModel240()  # type: ignore
                 else:
@@ -53,20 +79,38 @@ class LakeshoreService:
         except Exception as e:
             raise HTTPException(503, f"Connection failed: {e}")
 
-    def disconnect(self) -> None:
+    def disconnect(self, app: FastAPI) -> None:
         """
         Disconnect from the Model240 device.
 
+        The cache is cleared under the device lock, so no request or prefill step still
+        running against the device can write entries back afterwards.
+
         :param self: LakeshoreService instance
-        :return: True if disconnected, None if error occurred
-        :rtype: bool | None
+        :param app: FastAPI application instance
+        :type app: FastAPI
         """
-        if LakeshoreService.device:
-            try:
-                LakeshoreService.device.disconnect_usb()
-                LakeshoreService.device = None
-            except Exception as e:
-                raise HTTPException(503, f"Connection failed: {e}")
+        with app.state.lock:
+            if LakeshoreService.device:
+                try:
+                    LakeshoreService.device.disconnect_usb()
+                    LakeshoreService.device = None
+                    LakeshoreService.cache.clear()
+                    # Not ready again until the prefill after the next connect completes
+                    LakeshoreService.cache.ready = False
+                    LakeshoreService.cache.error = None
+                except Exception as e:
+                    raise HTTPException(503, f"Connection failed: {e}")
+
+    def is_ready(self) -> bool:
+        """
+        Whether the device is connected and the startup prefill has completed.
+
+        :param self: LakeshoreService instance
+        :return: True when ready to serve requests at full speed
+        :rtype: bool
+        """
+        return LakeshoreService.device is not None and LakeshoreService.cache.ready
 
     def get_device(self) -> Model240:
         """
@@ -80,6 +124,199 @@ class LakeshoreService:
             raise DeviceNotConnectedError()
         return LakeshoreService.device
 
+    @contextmanager
+    def _session(self, request: Request, timeout: float = DEFAULT_TIMEOUT) -> Iterator[Deadline]:
+        """
+        Hold the device lock for the duration of a request, bounded by its deadline.
+
+        Lock acquisition gives up once the deadline passes, so a slow device call
+        cannot queue every other request behind it indefinitely, and an expired deadline
+        is reported before any command is sent. The lock is reentrant:
+        nested sessions (e.g. operations run inside a batch) share the outer deadline.
+
+        :param self: LakeshoreService instance
+        :param request: FastAPI request object
+        :type request: Request
+        :param timeout: Endpoint default timeout, overridden by the client's header
+        :type timeout: float
+        :return: Deadline to check between device commands
+        :rtype: Iterator[Deadline]
+        """
+        outer = getattr(request.state, "deadline", None)
+        if outer is None:
+            tracer.mark("dispatch")  # Arrival until the handler runs in its threadpool worker
+        deadline = outer or Deadline.from_request(request, timeout)
+        lock = request.app.state.lock
+        with tracer.span("lock_wait"):
+            acquired = lock.acquire(timeout=deadline.remaining())
+        if not acquired:
+            raise DeadlineExceededError("device lock")
+        try:
+            deadline.check("device lock")
+        except DeadlineExceededError:
+            lock.release()
+            raise
+        request.state.deadline = deadline
+        try:
+            with tracer.span("device") if outer is None else nullcontext():
+                yield deadline
+        finally:
+            if outer is None:
+                del request.state.deadline
+            lock.release()
+
+    @staticmethod
+    def _audit(request: Request, operation: str, channel: int | None,
+               before: Any, after: Any, error: str | None = None) -> None:
+        # Only queues the entry, so it is safe while holding the device lock
+        request.app.state.audit.record(request, operation, channel, before, after, error)
+
+    def prefill(self, app: FastAPI) -> None:
+        """
+        Connect to the device and load its configuration into the cache in one ordered pass.
+
+        Identification and module name come first, then input parameters and curve headers
+        of every channel, and finally the curves, which cost 200 queries each. The device
+        lock is released between steps so API requests are served while this runs; a curve
+        written to while it is being read is left to be read on demand. A prefill stops once
+        the device is disconnected, and only one runs at a time.
+
+        :param self: LakeshoreService instance
+        :param app: FastAPI application instance
+        :type app: FastAPI
+        """
+        cache = LakeshoreService.cache
+        lock = app.state.lock
+        if not LakeshoreService._prefilling.acquire(blocking=False):
+            return  # Already running
+        try:
+            self.connect()
+            with lock:
+                device = self.get_device()
+                cache.identification = self._read_identification(device)
+                cache.modname = device.get_modname()
+            for channel in range(1, 9):
+                with lock:
+                    if LakeshoreService.device is not device:
+                        return  # Disconnected meanwhile; the next connect prefills again
+                    cache.input_parameters[channel] = self._read_input_parameter(device, channel)
+            for channel in range(1, 9):
+                with lock:
+                    if LakeshoreService.device is not device:
+                        return
+                    cache.curve_headers[channel] = CurveHeader(
+                        **device.get_curve_header(channel).__dict__)
+            for channel in range(1, 9):
+                with lock:
+                    if LakeshoreService.device is not device:
+                        return
+                    if channel in cache.curves:
+                        continue
+                    version = cache.curve_version(channel)
+                points: list[CurveDataPoint] = []
+                for start in range(1, 201, 20):
+                    with lock:
+                        if LakeshoreService.device is not device:
+                            return
+                        points += [self._read_curve_data_point(device, channel, index)
+                                   for index in range(start, start + 20)]
+                with lock:
+                    # Points read before a write to this curve are stale; it is then read on demand
+                    if channel not in cache.curves and cache.curve_version(channel) == version:
+                        cache.curves[channel] = CurveDataPoints(
+                            channel=channel,
+                            temperatures=[p.temperature for p in points],
+                            sensors=[p.sensor for p in points]
+                        )
+            with lock:
+                if LakeshoreService.device is not device:
+                    return
+                cache.ready = True
+                cache.error = None
+        except Exception as e:
+            cache.error = str(getattr(e, "detail", e))
+            print(f"Device prefill failed: {cache.error}")
+        finally:
+            LakeshoreService._prefilling.release()
+
+    @staticmethod
+    def _read_identification(device: Model240) -> IdentificationResp:
+        identification = device.get_identification()
+        return IdentificationResp(
+            manufacturer=identification['manufacturer'],
+            model=identification['model'],
+            serial_number=identification['serial number'],
+            firmware_version=identification['firmware version']
+        )
+
+    @staticmethod
+    def _read_input_parameter(device: Model240, channel: int) -> InputParameter:
+        input_param = device.get_input_parameter(channel).__dict__
+        return InputParameter(sensor_name=device.get_sensor_name(channel), **input_param, filter=device.get_filter(channel))
+
+    @staticmethod
+    def _read_curve_data_point(device: Model240, channel: int, index: int) -> CurveDataPoint:
+        sensor, temp = str(device.get_curve_data_point(channel, index)).split(',')
+        return CurveDataPoint(
+            temperature=float(temp),
+            sensor=float(sensor)
+        )
+
+    def _cached_input_parameter(self, device: Model240, channel: int) -> InputParameter:
+        cached = LakeshoreService.cache.input_parameters.get(channel)
+        if cached is None:
+            cached = self._read_input_parameter(device, channel)
+            LakeshoreService.cache.input_parameters[channel] = cached
+        return cached
+
+    def _cached_curve_header(self, device: Model240, channel: int) -> CurveHeader:
+        cached = LakeshoreService.cache.curve_headers.get(channel)
+        if cached is None:
+            cached = CurveHeader(**device.get_curve_header(channel).__dict__)
+            LakeshoreService.cache.curve_headers[channel] = cached
+        return cached
+
+    def _cached_curve(self, device: Model240, channel: int, deadline: Deadline) -> CurveDataPoints:
+        cached = LakeshoreService.cache.curves.get(channel)
+        if cached is None:
+            points = []
+            for index in range(1, 201):
+                deadline.check()
+                points.append(self._read_curve_data_point(device, channel, index))
+            cached = CurveDataPoints(
+                channel=channel,
+                temperatures=[p.temperature for p in points],
+                sensors=[p.sensor for p in points]
+            )
+            LakeshoreService.cache.curves[channel] = cached
+        return cached
+
+    @staticmethod
+    def _to_device_input(input_param: InputParameter) -> Model240InputParameter:
+        return Model240InputParameter(
+            sensor=input_param.sensor_type,
+            auto_range_enable=input_param.auto_range_enable,
+            current_reversal_enable=input_param.current_reversal_enable,
+            units=input_param.temperature_unit,
+            input_enable=input_param.input_enable,
+            input_range=input_param.input_range
+        )
+
+    @staticmethod
+    def _quantize_brightness(brightness: int) -> int:
+        # The display has five levels, 25% apart; BRIGT? reports which one is set
+        return (brightness + 12) // 25 * 25
+
+    @staticmethod
+    def _to_device_header(curve_header: CurveHeader) -> Model240CurveHeader:
+        return Model240CurveHeader(
+            curve_name=curve_header.curve_name,
+            serial_number=curve_header.serial_number,
+            curve_data_format=curve_header.curve_data_format,
+            temperature_limit=curve_header.temperature_limit,
+            coefficient=curve_header.coefficient
+        )
+
     @asynccontextmanager
     @staticmethod
     async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -91,28 +328,57 @@ class LakeshoreService:
         :return: Lifespan context manager
         :rtype: AsyncGenerator[None, None]
         """
-        app.state.lock = Lock()
+        from services.sequence import SequenceRunner  # Imports this module
+
+        app.state.lock = RLock()
+        app.state.events = EventHub()
+        app.state.sampler = ReadingSampler(
+            app.state.lock, LakeshoreService().get_device,
+            float(os.getenv(SAMPLE_INTERVAL, "0")), float(os.getenv(DEVICE_COMMAND_BUDGET, "20")))
+        app.state.alarms = AlarmEngine(app.state.events, os.getenv(ALARM_WEBHOOK_URL))
+        app.state.statistics = StatisticsEngine(app.state.events)
+        app.state.history = ReadingHistory(int(os.getenv(HISTORY_CAPACITY, "36000")))
+        app.state.admission = AdmissionController(
+            float(os.getenv(ADMISSION_RATE, "100")), float(os.getenv(ADMISSION_BURST, "400")),
+            int(os.getenv(ADMISSION_MAX_QUEUE, "8")),
+            api_keys=frozenset(key.strip() for key in os.getenv(API_KEYS, "").split(",") if key.strip()))
+        app.state.curve_library = CurveLibrary(os.getenv(CURVE_LIBRARY_DIR, "curves"))
+        app.state.audit = AuditJournal(
+            os.getenv(AUDIT_PATH, "audit/audit.jsonl"), os.getenv(AUDIT_FSYNC, "batch"),
+            int(os.getenv(AUDIT_MAX_BYTES, str(10 * 1024 * 1024))), int(os.getenv(AUDIT_BACKUPS, "5")))
+        app.state.audit.start()
+        app.state.sampler.add_listener(app.state.alarms.evaluate)
+        app.state.sampler.add_listener(app.state.statistics.update)
+        app.state.sampler.add_listener(app.state.history.update)
+        app.state.sampler.add_listener(publish_readings(app.state.events))
+        if app.state.sampler.interval > 0:
+            app.state.sampler.start()
+        app.state.sequences = SequenceRunner(app)
+        app.state.sequences.start()
+        Thread(target=LakeshoreService().prefill, args=(app,), name="device-prefill", daemon=True).start()
         yield
-        LakeshoreService().disconnect()
+        app.state.sequences.stop()
+        app.state.sampler.stop()
+        LakeshoreService().disconnect(app)
+        app.state.audit.stop()
 
     # =========== Device Methods ===========
 
-    def get_identification(self) -> IdentificationResp:
+    def get_identification(self, request: Request) -> IdentificationResp:
         """
         Return model240's identification parameters.
 
         :param self: LakeshoreService instance
+        :param request: FastAPI request object
+        :type request: Request
         :return: Identification parameters
         :rtype: IdentificationResp
         """
-        device = self.get_device()
-        identification = device.get_identification()
-        return IdentificationResp(
-            manufacturer=identification['manufacturer'],
-            model=identification['model'],
-            serial_number=identification['serial number'],
-            firmware_version=identification['firmware version']
-        )
+        with self._session(request):
+            device = self.get_device()
+            if LakeshoreService.cache.identification is None:
+                LakeshoreService.cache.identification = self._read_identification(device)
+            return LakeshoreService.cache.identification
 
     def get_status(self, request: Request, channel: int) -> StatusResp:
         """
@@ -131,7 +397,7 @@ class LakeshoreService:
         """
         if not 1 <= channel <= 8:
             raise ChannelError(channel)
-        with request.app.state.lock:
+        with self._session(request):
             device = self.get_device()
             status = device.get_channel_reading_status(channel)
             return StatusResp(
@@ -142,6 +408,44 @@ class LakeshoreService:
                 sensor_units_under_range=status['sensor units under range']
             )
 
+    def get_all_status(self, request: Request, compact: bool = False) -> AllStatusResp:
+        """
+        Return the status of every channel in one pass.
+
+        Channels with a fresh reading-sampler sample are served from it; the remaining
+        channels are queried under a single lock hold.
+
+        :param self: LakeshoreService instance
+        :param request: FastAPI request object
+        :type request: Request
+        :param compact: Return only the bitmasks, without the decoded flags
+        :type compact: bool
+        :return: Status of all channels
+        :rtype: AllStatusResp
+        """
+        sampler: ReadingSampler = request.app.state.sampler
+        sample = sampler.latest()
+        fresh = sampler.fresh(sample)
+        bitmasks = sample.status.tolist()
+        sampled_at = float(sample.timestamps[fresh].min()) if fresh.any() else None
+        if not fresh.all():
+            with self._session(request) as deadline:
+                device = self.get_device()
+                for channel in range(1, 9):
+                    if fresh[channel - 1]:
+                        continue
+                    deadline.check()
+                    bitmasks[channel - 1] = status_bits(
+                        device.get_channel_reading_status(channel))
+        return AllStatusResp(
+            bitmasks=bitmasks,
+            channels=None if compact else [
+                StatusResp(**{name: bool(bits & bit) for name, bit in STATUS_BITS.items()})
+                for bits in bitmasks
+            ],
+            sampled_at=sampled_at
+        )
+
     def get_modname(self, request: Request) -> str:
         """
         Return the Model240's module name.
@@ -152,9 +456,11 @@ class LakeshoreService:
         :return: Model240's module name
         :rtype: str
         """
-        with request.app.state.lock:
+        with self._session(request):
             device = self.get_device()
-            return device.get_modname()
+            if LakeshoreService.cache.modname is None:
+                LakeshoreService.cache.modname = device.get_modname()
+            return LakeshoreService.cache.modname
 
     def set_modname(self, request: Request, modname: str) -> None:
         """
@@ -166,12 +472,16 @@ class LakeshoreService:
         :param modname: New module name
         :type modname: str
         """
-        with request.app.state.lock:
+        with self._session(request):
+            before = LakeshoreService.cache.modname
             try:
                 device = self.get_device()
                 device.set_modname(modname)
+                LakeshoreService.cache.modname = modname
             except Exception as e:
+                self._audit(request, "setModuleName", None, before, modname, str(e))
                 raise HTTPException(503, f"Update failed: {e}")
+        self._audit(request, "setModuleName", None, before, modname)
 
     def get_brightness(self, request: Request) -> Brightness:
         """
@@ -183,7 +493,7 @@ class LakeshoreService:
         :return: Current brightness level
         :rtype: Brightness | None
         """
-        with request.app.state.lock:
+        with self._session(request):
             try:
                 device = self.get_device()
                 brightness = int(device.query("BRIGT?"))
@@ -191,6 +501,7 @@ class LakeshoreService:
                     raise HTTPException(400, "Invalid brightness level")
             except Exception as e:
                 raise HTTPException(503, f"Get brightness failed: {e}")
+            LakeshoreService.cache.brightness = brightness * 25
             return Brightness(brightness=brightness * 25)
 
     def set_brightness(self, request: Request, brightness: int) -> None:
@@ -200,40 +511,60 @@ class LakeshoreService:
         :param self: LakeshoreService instance
         :param request: FastAPI request object
         :type request: Request
-        :param brightness: New brightness level
+        :param brightness: New brightness level, rounded to the nearest 25%
         :type brightness: int
         """
         if not 0 <= brightness <= 100:
             raise HTTPException(
                 400, "Brightness must be between 0 and 100")
-        with request.app.state.lock:
+        brightness = self._quantize_brightness(brightness)
+        with self._session(request):
+            before = LakeshoreService.cache.brightness
             try:
                 device = self.get_device()
                 device.set_brightness(brightness)
+                LakeshoreService.cache.brightness = brightness
             except ValueError as e:
+                self._audit(request, "setBrightness", None, before, brightness, str(e))
                 raise HTTPException(400, f"Invalid brightness value: {e}")
             except Exception as e:
+                self._audit(request, "setBrightness", None, before, brightness, str(e))
                 raise HTTPException(503, f"Update failed: {e}")
+        self._audit(request, "setBrightness", None, before, brightness)
 
     # =========== Reading Methods ===========
-    def get_input_parameter(self, request: Request, channel: int) -> InputParameter:
+    def get_input_parameter(self, request: Request, channel: int,
+                            fields: set[str] | None = None) -> InputParameter:
         """
         Get the parameter details for the specified channel.
 
+        When only some fields are requested and the channel is not cached, only the device
+        queries that return those fields are made and the result holds just those fields.
+
         :param self: LakeshoreService instance
         :param request: FastAPI request object
         :type request: Request
         :param channel: Channel number
         :type channel: int
+        :param fields: Field names to read, or None for all
+        :type fields: set[str] | None
         :return: Input parameter details
         :rtype: InputParameter
         """
         if not 1 <= channel <= 8:
             raise ChannelError(channel)
-        with request.app.state.lock:
+        with self._session(request):
             device = self.get_device()
-            input_param = device.get_input_parameter(channel).__dict__
-            return InputParameter(sensor_name=device.get_sensor_name(channel), **input_param, filter=device.get_filter(channel))
+            if fields is None or channel in LakeshoreService.cache.input_parameters:
+                return self._cached_input_parameter(device, channel)
+            values = {}
+            if fields - {"sensor_name", "filter"}:
+                values.update(device.get_input_parameter(channel).__dict__)
+            if "sensor_name" in fields:
+                values["sensor_name"] = device.get_sensor_name(channel)
+            if "filter" in fields:
+                values["filter"] = device.get_filter(channel)
+            return InputParameter.model_construct(**values)
 
     def set_input_config(self, request: Request, input_param: InputParameter, channel: int) -> None:
         """
@@ -247,27 +578,33 @@ class LakeshoreService:
         :param channel: Description
         :type channel: int
         """
-        inp: Model240InputParameter = Model240InputParameter(
-            sensor=input_param.sensor_type,
-            auto_range_enable=input_param.auto_range_enable,
-            current_reversal_enable=input_param.current_reversal_enable,
-            units=input_param.temperature_unit,
-            input_enable=input_param.input_enable,
-            input_range=input_param.input_range
-        )
-        with request.app.state.lock:
+        inp = self._to_device_input(input_param)
+        with self._session(request):
+            before = LakeshoreService.cache.input_parameters.get(channel)
             try:
                 device = self.get_device()
+                LakeshoreService.cache.input_parameters.pop(channel, None)
                 device.set_input_parameter(channel, inp)
                 if input_param.filter:
                     device.set_filter(channel, input_param.filter)
                 if input_param.sensor_name:
                     device.set_sensor_name(
                         channel, input_param.sensor_name)
+                # Filter and sensor name are only written when provided; otherwise they are kept
+                written = input_param.model_copy(update={
+                    "filter": input_param.filter or (before.filter if before else device.get_filter(channel)),
+                    "sensor_name": input_param.sensor_name or (
+                        before.sensor_name if before else device.get_sensor_name(channel)),
+                })
+                LakeshoreService.cache.input_parameters[channel] = written
             except Exception as e:
+                self._audit(request, "setInputParameter", channel, before, input_param, str(e))
+                request.app.state.sampler.invalidate_inputs()  # The input may have been written
                 raise HTTPException(503, f"Update failed: {e}")
+        self._audit(request, "setInputParameter", channel, before, written)
+        request.app.state.sampler.set_input_enabled(channel, input_param.input_enable)
 
-    def get_monitor(self, request: Request, channel: int) -> MonitorResp:
+    def get_monitor(self, request: Request, channel: int, fields: set[str] | None = None) -> MonitorResp:
         """
         Return the temperature readings (Kelvin, Ohm) for the specified channel.
 
@@ -276,21 +613,115 @@ class LakeshoreService:
         :type request: Request
         :param channel: Channel number
         :type channel: int
+        :param fields: Readings to return, or None for kelvin and sensor. Sensor and kelvin
+            are one device query each; celsius and fahrenheit are computed from kelvin
+        :type fields: set[str] | None
         :return: Temperature readings for the specified channel
         :rtype: MonitorResp
         """
         if not 1 <= channel <= 8:
             raise ChannelError(channel)
-        with request.app.state.lock:
+        with self._session(request):
             device = self.get_device()
-            # celsius = device.get_celsius_reading(channel)
-            # farenheit = device.get_fahrenheit_reading(channel)
-            kelvin = device.get_kelvin_reading(channel)
-            sensor = device.get_sensor_reading(channel)
-            return MonitorResp(
-                kelvin=kelvin,
-                sensor=sensor
-            )
+            units = DEFAULT_UNITS if fields is None else [u for u, f in UNIT_FIELDS.items() if f in fields]
+            kelvin = device.get_kelvin_reading(channel) if needs_kelvin(units) else None
+            sensor = device.get_sensor_reading(channel) if "S" in units else None
+            return MonitorResp(**convert(kelvin, sensor, units))
+
+    def get_monitor_burst(self, request: Request, channels: list[int], count: int,
+                          units: list[TemperatureUnit] | None = None) -> BurstResp:
+        """
+        Take a burst of back-to-back readings of one or more channels and summarize them.
+
+        All readings are taken in a single device session at the device's maximum rate;
+        channels are read round-robin so their readings interleave in time.
+
+        :param self: LakeshoreService instance
+        :param request: FastAPI request object
+        :type request: Request
+        :param channels: Channel numbers, each read once per round
+        :type channels: list[int]
+        :param count: Number of readings per channel
+        :type count: int
+        :param units: Units to summarize, or None for kelvin and sensor
+        :type units: list[TemperatureUnit] | None
+        :return: Per-channel statistics of the readings and their timing
+        :rtype: BurstResp
+        """
+        for channel in channels:
+            if not 1 <= channel <= 8:
+                raise ChannelError(channel)
+        units = units or list(DEFAULT_UNITS)
+        read_kelvin, read_sensor = needs_kelvin(units), "S" in units
+        kelvin = np.empty((count, len(channels)))
+        sensor = np.empty((count, len(channels)))
+        times = np.empty((count, len(channels)))
+        with self._session(request, BURST_TIMEOUT) as deadline:
+            device = self.get_device()
+            started_at = time.time()
+            start = time.perf_counter()
+            for i in range(count):
+                deadline.check()
+                for j, channel in enumerate(channels):
+                    times[i, j] = time.perf_counter()
+                    if read_kelvin:
+                        kelvin[i, j] = device.get_kelvin_reading(channel)
+                    if read_sensor:
+                        sensor[i, j] = device.get_sensor_reading(channel)
+            duration = time.perf_counter() - start
+
+        def summarize(values: np.ndarray) -> list[BurstStats]:
+            stddev = values.std(axis=0, ddof=1) if len(values) > 1 else np.zeros(values.shape[1])
+            return [BurstStats(mean=mean, stddev=std, min=low, max=high) for mean, std, low, high in zip(
+                values.mean(axis=0).tolist(), stddev.tolist(),
+                values.min(axis=0).tolist(), values.max(axis=0).tolist())]
+
+        intervals = summarize(np.diff(times, axis=0)) if count > 1 else [None] * len(channels)
+        stats = {field: summarize(values)
+                 for field, values in convert(kelvin, sensor, units).items()}
+        return BurstResp(
+            started_at=started_at,
+            duration=duration,
+            channels=[
+                ChannelBurst(channel=channel, count=count, interval=intervals[j],
+                             **{field: column[j] for field, column in stats.items()})
+                for j, channel in enumerate(channels)
+            ]
+        )
+
+    def get_sampling_config(self, request: Request, channel: int) -> SamplingStatus:
+        """
+        Return the background sampling configuration and scheduler state of a channel.
+
+        :param self: LakeshoreService instance
+        :param request: FastAPI request object
+        :type request: Request
+        :param channel: Channel number
+        :type channel: int
+        :return: Sampling configuration and state
+        :rtype: SamplingStatus
+        """
+        if not 1 <= channel <= 8:
+            raise ChannelError(channel)
+        return request.app.state.sampler.get_config(channel)
+
+    def set_sampling_config(self, request: Request, config: SamplingConfig, channel: int) -> None:
+        """
+        Set the background sampling rate of a channel.
+
+        :param self: LakeshoreService instance
+        :param request: FastAPI request object
+        :type request: Request
+        :param config: Sampling configuration
+        :type config: SamplingConfig
+        :param channel: Channel number
+        :type channel: int
+        """
+        if not 1 <= channel <= 8:
+            raise ChannelError(channel)
+        if not request.app.state.sampler.running:
+            raise HTTPException(409, "Background sampling is disabled; set SAMPLE_INTERVAL to enable it")
+        request.app.state.sampler.set_config(channel, config)
 
     # =========== Curve Methods ===========
 
@@ -308,9 +739,9 @@ class LakeshoreService:
         """
         if not 1 <= channel <= 8:
             raise ChannelError(channel)
-        with request.app.state.lock:
+        with self._session(request):
             device = self.get_device()
-            return CurveHeader(**device.get_curve_header(channel).__dict__)
+            return self._cached_curve_header(device, channel)
 
     def get_curve_data_point(self, request: Request, channel: int, index: int) -> CurveDataPoint:
         """
@@ -328,18 +759,15 @@ class LakeshoreService:
         """
         if not 1 <= channel <= 8:
             raise ChannelError(channel)
-        with request.app.state.lock:
-            device = self.get_device()
-        if not 1 <= channel <= 8:
-            raise ChannelError(channel)
-        with request.app.state.lock:
+        with self._session(request):
             device = self.get_device()
-            sensor, temp = str(device.get_curve_data_point(
-                channel, index)).split(',')
-            return CurveDataPoint(
-                temperature=float(temp),
-                sensor=float(sensor)
-            )
+            curve = LakeshoreService.cache.curves.get(channel)
+            if curve is not None:
+                return CurveDataPoint(
+                    temperature=curve.temperatures[index - 1],
+                    sensor=curve.sensors[index - 1]
+                )
+            return self._read_curve_data_point(device, channel, index)
 
     def get_curve_data_points(self, request: Request, channel: int) -> CurveDataPoints:
         """
@@ -355,17 +783,9 @@ class LakeshoreService:
         """
         if not 1 <= channel <= 8:
             raise ChannelError(channel)
-        with request.app.state.lock:
+        with self._session(request, CURVE_TIMEOUT) as deadline:
             device = self.get_device()
-            raw_data = [device.get_curve_data_point(
-                channel, i).split(',') for i in range(1, 201)]
-            sensors = [dp[0] for dp in raw_data]
-            temperatures = [dp[1] for dp in raw_data]
-            return CurveDataPoints(
-                channel=channel,
-                temperatures=list(map(float, temperatures)),
-                sensors=list(map(float, sensors))
-            )
+            return self._cached_curve(device, channel, deadline)
 
     def set_curve_header(self, request: Request, curve_header: CurveHeader, channel: int) -> None:
         """
@@ -381,19 +801,17 @@ class LakeshoreService:
         """
         if not 1 <= channel <= 8:
             raise ChannelError(channel)
-        curve_header_resp = Model240CurveHeader(
-            curve_name=curve_header.curve_name,
-            serial_number=curve_header.serial_number,
-            curve_data_format=curve_header.curve_data_format,
-            temperature_limit=curve_header.temperature_limit,
-            coefficient=curve_header.coefficient
-        )
-        with request.app.state.lock:
+        curve_header_resp = self._to_device_header(curve_header)
+        with self._session(request):
+            before = LakeshoreService.cache.curve_headers.get(channel)
             try:
                 device = self.get_device()
                 device.set_curve_header(channel, curve_header_resp)
+                LakeshoreService.cache.curve_headers[channel] = curve_header
             except Exception as e:
+                self._audit(request, "setCurveHeader", channel, before, curve_header, str(e))
                 raise HTTPException(503, f"Update failed: {e}")
+        self._audit(request, "setCurveHeader", channel, before, curve_header)
 
     def set_curve_data_point(self, request: Request, data_point: CurveDataPoint, channel: int, index: int) -> None:
         """
@@ -411,13 +829,23 @@ class LakeshoreService:
         """
         if not 1 <= channel <= 8:
             raise ChannelError(channel)
-        with request.app.state.lock:
+        after = {"index": index, **data_point.model_dump(mode="json", by_alias=True)}
+        with self._session(request):
+            LakeshoreService.cache.curve_written(channel)
+            curve = LakeshoreService.cache.curves.get(channel)
+            before = None if curve is None else {
+                "index": index, "sensor": curve.sensors[index - 1], "temperature": curve.temperatures[index - 1]}
             try:
                 device = self.get_device()
                 device.set_curve_data_point(
                     channel, index, data_point.sensor, data_point.temperature)
+                if curve is not None:
+                    curve.sensors[index - 1] = data_point.sensor
+                    curve.temperatures[index - 1] = data_point.temperature
             except Exception as e:
+                self._audit(request, "setCurveDataPoint", channel, before, after, str(e))
                 raise HTTPException(503, f"Update failed: {e}")
+        self._audit(request, "setCurveDataPoint", channel, before, after)
 
     def delete_curve(self, request: Request, channel: int) -> None:
         """
@@ -431,12 +859,19 @@ class LakeshoreService:
         """
         if not 1 <= channel <= 8:
             raise ChannelError(channel)
-        with request.app.state.lock:
+        with self._session(request):
+            before = {"header": LakeshoreService.cache.curve_headers.get(channel),
+                      "curve": LakeshoreService.cache.curves.get(channel)}
             try:
                 device = self.get_device()
+                LakeshoreService.cache.curve_headers.pop(channel, None)
+                LakeshoreService.cache.curves.pop(channel, None)
+                LakeshoreService.cache.curve_written(channel)
                 device.delete_curve(channel)
             except Exception as e:
+                self._audit(request, "deleteCurve", channel, before, None, str(e))
                 raise HTTPException(503, f"Delete curve failed: {e}")
+        self._audit(request, "deleteCurve", channel, before, None)
 
     def set_factory_defaults(self, request: Request) -> None:
         """
@@ -446,9 +881,232 @@ class LakeshoreService:
         :param request: FastAPI request object
         :type request: Request
         """
-        with request.app.state.lock:
+        with self._session(request):
+            cache = LakeshoreService.cache
+            before = {"modname": cache.modname, "brightness": cache.brightness,
+                      "inputParameters": dict(cache.input_parameters), "curveHeaders": dict(cache.curve_headers)}
             try:
                 device = self.get_device()
+                LakeshoreService.cache.clear()
                 device.set_factory_defaults()
             except Exception as e:
+                self._audit(request, "setFactoryDefaults", None, before, None, str(e))
+                request.app.state.sampler.invalidate_inputs()
                 raise HTTPException(503, f"Factory reset failed: {e}")
+        self._audit(request, "setFactoryDefaults", None, before, None)
+        request.app.state.sampler.invalidate_inputs()
+
+    # =========== Configuration Methods ===========
+
+    def get_config(self, request: Request) -> DeviceConfig:
+        """
+        Export a snapshot of the full device configuration.
+
+        Served from the device cache where possible; missing entries are read from the device.
+
+        :param self: LakeshoreService instance
+        :param request: FastAPI request object
+        :type request: Request
+        :return: Configuration snapshot
+        :rtype: DeviceConfig
+        """
+        with self._session(request, CONFIG_TIMEOUT) as deadline:
+            device = self.get_device()
+            return self._snapshot(device, deadline)
+
+    def apply_config(self, request: Request, config: DeviceConfig, dry_run: bool = False) -> ConfigApplyResult:
+        """
+        Apply a configuration snapshot, writing only the settings that differ from the device.
+
+        The diff is computed against the cached state and every write runs under a single
+        device lock hold.
+
+        :param self: LakeshoreService instance
+        :param request: FastAPI request object
+        :type request: Request
+        :param config: Target configuration
+        :type config: DeviceConfig
+        :param dry_run: Only compute the changes, do not write them
+        :type dry_run: bool
+        :return: Settings that were (or would be) changed
+        :rtype: ConfigApplyResult
+        """
+        if config.version != CONFIG_VERSION:
+            raise HTTPException(
+                400, f"Unsupported configuration version {config.version}, expected {CONFIG_VERSION}")
+        for channel_config in config.channels:
+            curve = channel_config.curve
+            if curve.channel != channel_config.channel:
+                raise HTTPException(
+                    400, f"Curve of channel {channel_config.channel} is for channel {curve.channel}")
+            if len(curve.sensors) != 200 or len(curve.temperatures) != 200:
+                raise HTTPException(
+                    400, f"Curve of channel {channel_config.channel} must have 200 points")
+        with self._session(request, CONFIG_TIMEOUT) as deadline:
+            device = self.get_device()
+            current = self._snapshot(device, deadline)
+            changes = self._diff_config(device, current, config)
+            if not dry_run:
+                try:
+                    self._apply_changes(request, "setDeviceConfig", None, changes, deadline)
+                finally:
+                    # Inputs may have been enabled or disabled, even if a later write failed
+                    request.app.state.sampler.invalidate_inputs()
+        return ConfigApplyResult(dry_run=dry_run, changes=[change[0] for change in changes])
+
+    def _apply_changes(self, request: Request, operation: str, channel: int | None,
+                       changes: list[Change], deadline: Deadline) -> None:
+        """
+        Run the writes of a diff in order, recording them as one audit journal entry.
+
+        The entry maps each change's description to its value before and after, and holds
+        the error if a write failed or the deadline passed part way through.
+        """
+        error = None
+        try:
+            for description, write, _, _ in changes:
+                deadline.check()
+                try:
+                    write()
+                except Exception as e:
+                    raise HTTPException(503, f"Update failed at {description}: {e}")
+        except Exception as e:
+            error = str(getattr(e, "detail", e))
+            raise
+        finally:
+            if changes:
+                self._audit(request, operation, channel,
+                            {description: before for description, _, before, _ in changes},
+                            {description: after for description, _, _, after in changes}, error)
+
+    def _snapshot(self, device: Model240, deadline: Deadline) -> DeviceConfig:
+        cache = LakeshoreService.cache
+        if cache.modname is None:
+            cache.modname = device.get_modname()
+        if cache.brightness is None:
+            try:
+                cache.brightness = int(device.query("BRIGT?")) * 25
+            except Exception:
+                pass  # Brightness is optional in the snapshot
+        channels = []
+        for channel in range(1, 9):
+            deadline.check()
+            channels.append(ChannelConfig(
+                channel=channel,
+                input_parameter=self._cached_input_parameter(device, channel),
+                curve_header=self._cached_curve_header(device, channel),
+                curve=self._cached_curve(device, channel, deadline)
+            ))
+        return DeviceConfig(module_name=cache.modname, brightness=cache.brightness, channels=channels)
+
+    def _diff_config(self, device: Model240, current: DeviceConfig,
+                     target: DeviceConfig) -> list[Change]:
+        """
+        Build the ordered list of writes that turn the current configuration into the target.
+
+        Each write updates the cache along with the device.
+        """
+        cache = LakeshoreService.cache
+        changes: list[Change] = []
+
+        if target.module_name != current.module_name:
+            def write_modname(name: str = target.module_name) -> None:
+                device.set_modname(name)
+                cache.modname = name
+            changes.append(("module name", write_modname, current.module_name, target.module_name))
+
+        brightness = None if target.brightness is None else self._quantize_brightness(target.brightness)
+        if brightness is not None and brightness != current.brightness:
+            def write_brightness(brightness: int = brightness) -> None:
+                device.set_brightness(brightness)
+                cache.brightness = brightness
+            changes.append(("brightness", write_brightness, current.brightness, brightness))
+
+        existing = {c.channel: c for c in current.channels}
+        for wanted in target.channels:
+            channel, have = wanted.channel, existing[wanted.channel]
+
+            settings = {"sensor_name", "filter"}
+            if wanted.input_parameter.model_dump(exclude=settings) != have.input_parameter.model_dump(exclude=settings):
+                def write_input(channel: int = channel, param: InputParameter = wanted.input_parameter) -> None:
+                    device.set_input_parameter(channel, self._to_device_input(param))
+                    cache.input_parameters[channel] = cache.input_parameters[channel].model_copy(
+                        update=param.model_dump(exclude=settings))
+                changes.append((f"channel {channel} input parameter", write_input,
+                                have.input_parameter.model_dump(by_alias=True, exclude=settings),
+                                wanted.input_parameter.model_dump(by_alias=True, exclude=settings)))
+            if wanted.input_parameter.filter and wanted.input_parameter.filter != have.input_parameter.filter:
+                def write_filter(channel: int = channel, value: str = wanted.input_parameter.filter) -> None:
+                    device.set_filter(channel, value)
+                    cache.input_parameters[channel] = cache.input_parameters[channel].model_copy(
+                        update={"filter": value})
+                changes.append((f"channel {channel} filter", write_filter,
+                                have.input_parameter.filter, wanted.input_parameter.filter))
+            if wanted.input_parameter.sensor_name and wanted.input_parameter.sensor_name != have.input_parameter.sensor_name:
+                def write_name(channel: int = channel, value: str = wanted.input_parameter.sensor_name) -> None:
+                    device.set_sensor_name(channel, value)
+                    cache.input_parameters[channel] = cache.input_parameters[channel].model_copy(
+                        update={"sensor_name": value})
+                changes.append((f"channel {channel} sensor name", write_name,
+                                have.input_parameter.sensor_name, wanted.input_parameter.sensor_name))
+
+            changes += self._diff_curve(device, channel, have.curve_header, have.curve,
+                                        wanted.curve_header, wanted.curve.sensors, wanted.curve.temperatures)
+        return changes
+
+    def _diff_curve(self, device: Model240, channel: int, have_header: CurveHeader, have: CurveDataPoints,
+                    header: CurveHeader, sensors: list[float],
+                    temperatures: list[float]) -> list[Change]:
+        """
+        Build the writes that turn a channel's current curve into the target curve.
+
+        Only points that differ (beyond float round-off) are written.
+        """
+        cache = LakeshoreService.cache
+        changes: list[Change] = []
+        if header != have_header:
+            def write_header(header: CurveHeader = header) -> None:
+                device.set_curve_header(channel, self._to_device_header(header))
+                cache.curve_headers[channel] = header
+            changes.append((f"channel {channel} curve header", write_header, have_header, header))
+
+        new_sensors, new_temperatures = np.asarray(sensors), np.asarray(temperatures)
+        same = (np.isclose(new_sensors, have.sensors, rtol=1e-6, atol=1e-9)
+                & np.isclose(new_temperatures, have.temperatures, rtol=1e-6, atol=1e-9))
+        for i in np.flatnonzero(~same).tolist():
+            def write_point(i: int = i, sensor: float = float(new_sensors[i]),
+                            temperature: float = float(new_temperatures[i])) -> None:
+                device.set_curve_data_point(channel, i + 1, sensor, temperature)
+                cache.curve_written(channel)
+                curve = cache.curves[channel]
+                curve.sensors[i] = sensor
+                curve.temperatures[i] = temperature
+            changes.append((f"channel {channel} curve point {i + 1}", write_point,
+                            {"sensor": have.sensors[i], "temperature": have.temperatures[i]},
+                            {"sensor": float(new_sensors[i]), "temperature": float(new_temperatures[i])}))
+        return changes
+
+    def assign_curve(self, request: Request, curve: LibraryCurve, channel: int) -> list[str]:
+        """
+        Upload a library curve to a channel, writing only the header and points that differ.
+
+        :param self: LakeshoreService instance
+        :param request: FastAPI request object
+        :type request: Request
+        :param curve: Curve from the curve library
+        :type curve: LibraryCurve
+        :param channel: Channel number
+        :type channel: int
+        :return: Settings that were written
+        :rtype: list[str]
+        """
+        if not 1 <= channel <= 8:
+            raise ChannelError(channel)
+        with self._session(request, CURVE_TIMEOUT) as deadline:
+            device = self.get_device()
+            changes = self._diff_curve(
+                device, channel,
+                self._cached_curve_header(device, channel), self._cached_curve(device, channel, deadline),
+                curve.header, curve.sensors, curve.temperatures)
+            self._apply_changes(request, "assignLibraryCurve", channel, changes, deadline)
+        return [change[0] for change in changes]
@@ -0,0 +1,42 @@
+from collections import Counter
+from threading import Lock
+
+
+class Metrics:
+    """In-process counters exported through the metrics endpoint."""
+
+    def __init__(self) -> None:
+        self._counters: Counter[str] = Counter()
+        self._lock = Lock()
+
+    def increment(self, name: str, value: int = 1, **labels: str) -> None:
+        """
+        Increment a counter, optionally qualified by labels.
+
+        :param self: Metrics instance
+        :param name: Counter name
+        :type name: str
+        :param value: Amount to add
+        :type value: int
+        :param labels: Label key/values appended to the counter key
+        :type labels: str
+        """
+        key = name
+        if labels:
+            key += "{" + ",".join(f'{k}="{v}"' for k, v in sorted(labels.items())) + "}"
+        with self._lock:
+            self._counters[key] += value
+
+    def snapshot(self) -> dict[str, int]:
+        """
+        Return a copy of all counters.
+
+        :param self: Metrics instance
+        :return: Counter values keyed by name and labels
+        :rtype: dict[str, int]
+        """
+        with self._lock:
+            return dict(self._counters)
+
+
+metrics = Metrics()
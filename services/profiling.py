@@ -0,0 +1,234 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from threading import Lock
+from types import FrameType
+
+from fastapi import HTTPException
+
+from schemas.profiling import MemorySnapshot, MemoryStat, RequestTrace, Span
+
+# Longest sampling profile that can be requested, in seconds
+MAX_PROFILE_DURATION = 60.0
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """
+    Sampling profiler over every thread of the process, one profile at a time.
+
+    Stacks are taken with ``sys._current_frames`` at a fixed interval and returned in the
+    folded format (``thread;outer;...;inner count``) read by flamegraph.pl and speedscope.
+    Sampling only reads interpreter state, so it can run against the live service.
+    """
+
+    def __init__(self) -> None:
+        self._running = Lock()
+
+    def profile(self, duration: float, interval: float) -> str:
+        """
+        Sample all thread stacks for a while and return them folded.
+
+        :param self: StackSampler instance
+        :param duration: Seconds to sample for
+        :type duration: float
+        :param interval: Seconds between samples
+        :type interval: float
+        :return: Folded stacks, one ``stack count`` line each
+        :rtype: str
+        """
+        if not self._running.acquire(blocking=False):
+            raise HTTPException(409, "A profile is already running")
+        try:
+            me = threading.get_ident()
+            folded: Counter[str] = Counter()
+            end = time.monotonic() + min(duration, MAX_PROFILE_DURATION)
+            while time.monotonic() < end:
+                names = {t.ident: t.name for t in threading.enumerate()}
+                for ident, frame in sys._current_frames().items():
+                    if ident == me:
+                        continue
+                    stack = []
+                    f: FrameType | None = frame
+                    while f is not None:
+                        stack.append(_frame_label(f))
+                        f = f.f_back
+                    stack.append(names.get(ident, str(ident)))
+                    folded[";".join(reversed(stack))] += 1
+                time.sleep(interval)
+            return "".join(f"{stack} {count}\n" for stack, count in folded.most_common())
+        finally:
+            self._running.release()
+
+    async def run(self, duration: float, interval: float) -> str:
+        """
+        Run profile() in a thread of its own, so no request worker is held while sampling.
+
+        :param self: StackSampler instance
+        :param duration: Seconds to sample for
+        :type duration: float
+        :param interval: Seconds between samples
+        :type interval: float
+        :return: Folded stacks, one ``stack count`` line each
+        :rtype: str
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+
+        def settle(result: str | None, error: BaseException | None) -> None:
+            if future.done():
+                return  # The request went away
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        def target() -> None:
+            try:
+                result = self.profile(duration, interval)
+            except BaseException as e:
+                loop.call_soon_threadsafe(settle, None, e)
+            else:
+                loop.call_soon_threadsafe(settle, result, None)
+
+        threading.Thread(target=target, name="stack-sampler", daemon=True).start()
+        return await future
+
+
+class Tracer:
+    """
+    Per-request span timelines, recorded while tracing is enabled.
+
+    A request's spans are collected in a context variable, which follows the request into
+    the threadpool, so service code can open spans without being passed a handle. The
+    most recent ``size`` traces are kept.
+    """
+
+    _current: ContextVar[tuple[float, list[Span]] | None] = ContextVar("trace", default=None)
+
+    def __init__(self, size: int = 500) -> None:
+        self.enabled = False
+        self._traces: deque[RequestTrace] = deque(maxlen=size)
+        self._lock = Lock()
+
+    def begin(self, received_at: float) -> Token | None:
+        if not self.enabled:
+            return None
+        return self._current.set((received_at, []))
+
+    def finish(self, token: Token, method: str, path: str, status_code: int) -> None:
+        """
+        Close the current request's trace and store it.
+
+        :param self: Tracer instance
+        :param token: Token returned by begin()
+        :type token: Token
+        :param method: HTTP method
+        :type method: str
+        :param path: Request path
+        :type path: str
+        :param status_code: Response status code
+        :type status_code: int
+        """
+        origin, spans = self._current.get()
+        self._current.reset(token)
+        now = time.monotonic()
+        if spans:
+            last = max(span.start + span.duration for span in spans)
+            spans.append(Span(name="serialize", start=last, duration=now - origin - last))
+        with self._lock:
+            self._traces.append(RequestTrace(
+                method=method, path=path, status_code=status_code,
+                started_at=time.time() - (now - origin), duration=now - origin,
+                spans=sorted(spans, key=lambda span: span.start)))
+
+    def mark(self, name: str) -> None:
+        """Record a span from the request's arrival until now."""
+        current = self._current.get()
+        if current is not None:
+            origin, spans = current
+            spans.append(Span(name=name, start=0.0, duration=time.monotonic() - origin))
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Record the duration of the enclosed block as a span of the current request."""
+        current = self._current.get()
+        if current is None:
+            yield
+            return
+        origin, spans = current
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            spans.append(Span(name=name, start=start - origin, duration=time.monotonic() - start))
+
+    def traces(self, limit: int, min_duration: float = 0.0) -> list[RequestTrace]:
+        with self._lock:
+            traces = [t for t in self._traces if t.duration >= min_duration]
+        return traces[-limit:][::-1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+
+class MemoryTracker:
+    """tracemalloc snapshots, each compared with the previous one to show growth."""
+
+    def __init__(self) -> None:
+        self._previous: tracemalloc.Snapshot | None = None
+
+    def start(self, frames: int) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self._previous = None
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+        self._previous = None
+
+    def snapshot(self, limit: int) -> MemorySnapshot:
+        """
+        Take a snapshot and return the largest allocation sites and their growth.
+
+        :param self: MemoryTracker instance
+        :param limit: Number of sites to return
+        :type limit: int
+        :return: Allocation sites, by size
+        :rtype: MemorySnapshot
+        """
+        if not tracemalloc.is_tracing():
+            raise HTTPException(409, "tracemalloc is not running")
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)])
+        if self._previous is not None:
+            stats = snapshot.compare_to(self._previous, "lineno")
+            rows = [(s.traceback, s.size, s.size_diff, s.count, s.count_diff) for s in stats]
+        else:
+            rows = [(s.traceback, s.size, s.size, s.count, s.count) for s in snapshot.statistics("lineno")]
+        self._previous = snapshot
+        current, peak = tracemalloc.get_traced_memory()
+        return MemorySnapshot(
+            traced_current=current,
+            traced_peak=peak,
+            stats=[MemoryStat(location=str(traceback), size=size, size_diff=size_diff,
+                              count=count, count_diff=count_diff)
+                   for traceback, size, size_diff, count, count_diff in rows[:limit]]
+        )
+
+
+sampler = StackSampler()
+tracer = Tracer()
+memory = MemoryTracker()
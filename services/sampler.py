@@ -0,0 +1,279 @@
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Event, Lock, RLock, Thread
+
+import numpy as np
+from lakeshore import Model240
+
+from constants.status import STATUS_BITS
+from exceptions.lakeshore import LakeshoreError
+from schemas.reading import ReadingEvent, SamplingConfig, SamplingStatus
+from services.events import EventHub
+
+CHANNELS = 8
+
+# kelvin, sensor and status are read for every sampled channel
+COMMANDS_PER_SAMPLE = 3
+
+
+@dataclass
+class Sample:
+    """Latest reading of every channel; index 0 holds channel 1. Unsampled channels are NaN."""
+
+    timestamps: np.ndarray  # wall-clock seconds, float64
+    kelvin: np.ndarray  # float64
+    sensor: np.ndarray  # float64
+    status: np.ndarray  # RDGST? bitmask, uint8
+    updated: np.ndarray  # channels refreshed by the pass that produced this sample, bool
+
+
+def status_bits(status: dict[str, bool]) -> int:
+    """
+    Pack the driver's channel reading status dictionary into the RDGST? bitmask.
+
+    :param status: Result of Model240.get_channel_reading_status
+    :type status: dict[str, bool]
+    :return: Status bitmask
+    :rtype: int
+    """
+    return sum(bit for name, bit in STATUS_BITS.items() if status.get(name.replace("_", " ")))
+
+
+def publish_readings(hub: EventHub) -> Callable[[Sample], None]:
+    """
+    Build a sampler listener that publishes refreshed channels as ``reading`` events.
+
+    :param hub: Event hub to publish to
+    :type hub: EventHub
+    :return: Sampler listener
+    :rtype: Callable[[Sample], None]
+    """
+    def listener(sample: Sample) -> None:
+        if not hub.has_subscribers("reading"):
+            return
+        for i in sample.updated.nonzero()[0]:
+            hub.publish("reading", ReadingEvent(
+                channel=int(i) + 1,
+                timestamp=float(sample.timestamps[i]),
+                kelvin=float(sample.kelvin[i]),
+                sensor=float(sample.sensor[i]),
+                status=int(sample.status[i])
+            ).model_dump_json(by_alias=True, exclude_none=True))
+    return listener
+
+
+class ReadingSampler:
+    """
+    Background scheduler that reads kelvin, sensor and status of each channel at its own rate.
+
+    Every channel has a target interval, switches to a faster one while its rate of change
+    exceeds a threshold, and is skipped while its input is disabled on the device. The
+    total number of device commands per second is capped by ``budget``; when more
+    channels are due than the budget allows, the most overdue are read first.
+
+    The device lock is taken per channel, so API requests interleave with sampling.
+    Listeners are called from the sampler thread after each pass and must be fast.
+    """
+
+    def __init__(self, lock: RLock, get_device: Callable[[], Model240],
+                 interval: float, budget: float = 20.0) -> None:
+        self.lock = lock
+        self.get_device = get_device
+        self.interval = interval
+        self.budget = budget
+        self._sample = Sample(
+            timestamps=np.full(CHANNELS, np.nan),
+            kelvin=np.full(CHANNELS, np.nan),
+            sensor=np.full(CHANNELS, np.nan),
+            status=np.zeros(CHANNELS, dtype=np.uint8),
+            updated=np.zeros(CHANNELS, dtype=bool),
+        )
+        self._sample_lock = Lock()
+        self._config = {ch: SamplingConfig(interval=interval or 1.0)
+                        for ch in range(1, CHANNELS + 1)}
+        self._input_enabled: np.ndarray | None = None
+        self._fast = np.zeros(CHANNELS, dtype=bool)
+        self._next_due = np.zeros(CHANNELS)
+        self._listeners: list[Callable[[Sample], None]] = []
+        self._stop = Event()
+        self._thread: Thread | None = None
+
+    def add_listener(self, listener: Callable[[Sample], None]) -> None:
+        self._listeners.append(listener)
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = Thread(target=self._run, name="reading-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def latest(self) -> Sample:
+        """
+        Return a copy of the most recent sample of every channel.
+
+        :param self: ReadingSampler instance
+        :return: Latest sample
+        :rtype: Sample
+        """
+        with self._sample_lock:
+            return Sample(**{k: v.copy() for k, v in self._sample.__dict__.items()})
+
+    def fresh(self, sample: Sample) -> np.ndarray:
+        """
+        Return which channels of a sample are recent enough to serve instead of the device.
+
+        A reading is fresh while it is younger than twice its channel's current interval.
+
+        :param self: ReadingSampler instance
+        :param sample: Sample returned by latest()
+        :type sample: Sample
+        :return: Boolean mask, index 0 is channel 1
+        :rtype: np.ndarray
+        """
+        if not self.running:
+            return np.zeros(CHANNELS, dtype=bool)
+        with np.errstate(invalid="ignore"):
+            return time.time() - sample.timestamps <= 2 * self._intervals()
+
+    # =========== Scheduling ===========
+
+    def get_config(self, channel: int) -> SamplingStatus:
+        config = self._config[channel]
+        enabled = self._input_enabled
+        return SamplingStatus(
+            channel=channel,
+            config=config,
+            input_enabled=None if enabled is None else bool(enabled[channel - 1]),
+            fast=bool(self._fast[channel - 1]),
+            effective_interval=float(self._intervals()[channel - 1]),
+        )
+
+    def set_config(self, channel: int, config: SamplingConfig) -> None:
+        self._config[channel] = config
+        self._fast[channel - 1] = False
+        self._next_due[channel - 1] = 0.0
+
+    def set_input_enabled(self, channel: int, enabled: bool) -> None:
+        """
+        Record a channel's input_enable flag after it was changed through the API.
+
+        :param self: ReadingSampler instance
+        :param channel: Channel number
+        :type channel: int
+        :param enabled: New input_enable value
+        :type enabled: bool
+        """
+        if self._input_enabled is not None:
+            self._input_enabled[channel - 1] = enabled
+            self._next_due[channel - 1] = 0.0
+
+    def invalidate_inputs(self) -> None:
+        """Re-read every channel's input_enable flag before the next pass, e.g. after a factory reset."""
+        self._input_enabled = None
+
+    def _intervals(self) -> np.ndarray:
+        return np.array([
+            config.fast_interval if fast and config.fast_interval else config.interval
+            for config, fast in zip(self._config.values(), self._fast)
+        ])
+
+    def _refresh_input_enabled(self) -> None:
+        enabled = np.zeros(CHANNELS, dtype=bool)
+        for channel in range(1, CHANNELS + 1):
+            with self.lock:
+                enabled[channel - 1] = self.get_device().get_input_parameter(channel).input_enable
+        self._input_enabled = enabled
+
+    def _due(self, now: float) -> np.ndarray:
+        assert self._input_enabled is not None
+        active = self._input_enabled & np.array([c.enabled for c in self._config.values()])
+        due = np.flatnonzero(active & (self._next_due <= now))
+        return due[np.argsort(self._next_due[due], kind="stable")] + 1
+
+    def _run(self) -> None:
+        tokens = self.budget
+        last = time.monotonic()
+        while not self._stop.is_set():
+            now = time.monotonic()
+            tokens = min(self.budget, tokens + (now - last) * self.budget)
+            last = now
+            try:
+                if self._input_enabled is None:
+                    self._refresh_input_enabled()
+                    tokens -= CHANNELS
+                due = self._due(now)[:max(int(tokens // COMMANDS_PER_SAMPLE), 0)]
+                if len(due):
+                    self.sample_channels(due.tolist())
+                    tokens -= len(due) * COMMANDS_PER_SAMPLE
+            except LakeshoreError:
+                self._input_enabled = None  # Not connected; re-read inputs once it is
+            except Exception as e:
+                print(f"Sampling failed: {e}")
+            self._stop.wait(self._wait_time(tokens))
+
+    def _wait_time(self, tokens: float) -> float:
+        if self._input_enabled is None:
+            return 1.0
+        wait = 1.0
+        active = self._input_enabled & np.array([c.enabled for c in self._config.values()])
+        if active.any():
+            wait = min(wait, float(self._next_due[active].min()) - time.monotonic())
+        if tokens < COMMANDS_PER_SAMPLE:
+            wait = max(wait, (COMMANDS_PER_SAMPLE - tokens) / self.budget)
+        return max(wait, 0.001)
+
+    def sample_channels(self, channels) -> None:
+        """
+        Read the given channels from the device, reschedule them and notify listeners.
+
+        :param self: ReadingSampler instance
+        :param channels: Channel numbers (1-8) to read
+        """
+        readings = []
+        for channel in channels:
+            if not self.lock.acquire(timeout=1.0):
+                continue
+            try:
+                device = self.get_device()
+                kelvin = device.get_kelvin_reading(channel)
+                sensor = device.get_sensor_reading(channel)
+                status = status_bits(device.get_channel_reading_status(channel))
+            finally:
+                self.lock.release()
+            readings.append((channel - 1, time.time(), kelvin, sensor, status))
+        if not readings:
+            return
+        with self._sample_lock:
+            sample = self._sample
+            sample.updated[:] = False
+            for i, timestamp, kelvin, sensor, status in readings:
+                config = self._config[i + 1]
+                if config.rate_threshold is not None and not np.isnan(sample.kelvin[i]):
+                    rate = abs(kelvin - sample.kelvin[i]) / max(timestamp - sample.timestamps[i], 1e-6)
+                    self._fast[i] = rate > config.rate_threshold
+                sample.timestamps[i] = timestamp
+                sample.kelvin[i] = kelvin
+                sample.sensor[i] = sensor
+                sample.status[i] = status
+                sample.updated[i] = True
+        now = time.monotonic()
+        intervals = self._intervals()
+        for i, *_ in readings:
+            self._next_due[i] = now + intervals[i]
+        snapshot = self.latest()
+        for listener in self._listeners:
+            try:
+                listener(snapshot)
+            except Exception as e:
+                print(f"Sample listener failed: {e}")
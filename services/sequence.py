@@ -0,0 +1,239 @@
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from threading import Condition, Event, Thread
+from typing import Any
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+
+from exceptions.lakeshore import LakeshoreError
+from schemas.sequence import (
+    DelayStep, OperationStep, SampleStep, SequenceRequest, SequenceResult, SequenceState,
+    SequenceStatus, SequenceStep, StepResult, WaitStableStep,
+)
+from services.batch import OPERATIONS, run_operation
+from services.lakeshore import LakeshoreService
+from services.statistics import RollingWindow
+from services.admission import API_KEY_HEADER
+
+# Finished jobs kept for their results before the oldest are dropped
+MAX_FINISHED = 100
+
+
+class SequenceCancelled(Exception):
+    """Raised inside a running step when its job has been cancelled."""
+
+
+@dataclass
+class SequenceJob:
+    id: str
+    sequence: SequenceRequest
+    state: SequenceState = "pending"
+    current_step: int = 0
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+    results: list[StepResult] = field(default_factory=list)
+    cancel: Event = field(default_factory=Event)
+    # Identity of the submitting client, given to each step's request for the audit journal
+    headers: list[tuple[bytes, bytes]] = field(default_factory=list)
+    client: tuple[str, int] | None = None
+
+    def status(self) -> SequenceStatus:
+        return SequenceStatus(
+            id=self.id,
+            name=self.sequence.name,
+            state=self.state,
+            current_step=self.current_step,
+            total_steps=len(self.sequence.steps),
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            error=self.error,
+        )
+
+
+class SequenceRunner:
+    """
+    Background executor of measurement sequences, one job at a time in submission order.
+
+    Steps run next to the device: API operations and bursts each take the device lock
+    for their own duration only, and waiting steps release it between readings, so other
+    clients and the sampler keep access while a sequence runs. A job can be cancelled at
+    any time; a running step stops at its next reading or wait.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        self.app = app
+        self._jobs: OrderedDict[str, SequenceJob] = OrderedDict()
+        self._queue: deque[SequenceJob] = deque()
+        self._condition = Condition()
+        self._stop = False
+        self._thread: Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop = False
+            self._thread = Thread(target=self._run, name="sequence-runner", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stop = True
+            for job in self._jobs.values():
+                job.cancel.set()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, sequence: SequenceRequest, request: Request) -> SequenceStatus:
+        """
+        Validate a sequence and queue it for execution.
+
+        :param self: SequenceRunner instance
+        :param sequence: Sequence to run
+        :type sequence: SequenceRequest
+        :param request: Submitting request, whose client the steps act on behalf of
+        :type request: Request
+        :return: Status of the queued job
+        :rtype: SequenceStatus
+        """
+        unknown = [step.operation_id for step in sequence.steps
+                   if isinstance(step, OperationStep) and step.operation_id not in OPERATIONS]
+        if unknown:
+            raise HTTPException(400, f"Unsupported operations: {', '.join(unknown)}")
+        key = request.headers.get(API_KEY_HEADER)
+        job = SequenceJob(id=uuid.uuid4().hex, sequence=sequence,
+                          headers=[(API_KEY_HEADER.lower().encode(), key.encode())] if key else [],
+                          client=request.scope.get("client"))
+        with self._condition:
+            self._jobs[job.id] = job
+            self._queue.append(job)
+            self._condition.notify_all()
+        return job.status()
+
+    def list(self) -> list[SequenceStatus]:
+        with self._condition:
+            return [job.status() for job in self._jobs.values()]
+
+    def get(self, sequence_id: str) -> SequenceStatus:
+        with self._condition:
+            return self._job(sequence_id).status()
+
+    def get_result(self, sequence_id: str) -> SequenceResult:
+        with self._condition:
+            job = self._job(sequence_id)
+            return SequenceResult(status=job.status(), results=list(job.results))
+
+    def cancel(self, sequence_id: str) -> SequenceStatus:
+        """
+        Cancel a queued or running job. Finished jobs are left unchanged.
+
+        :param self: SequenceRunner instance
+        :param sequence_id: Job id
+        :type sequence_id: str
+        :return: Status of the job after cancellation
+        :rtype: SequenceStatus
+        """
+        with self._condition:
+            job = self._job(sequence_id)
+            if job.state == "pending":
+                self._queue.remove(job)
+                self._finish(job, "cancelled")
+            elif job.state == "running":
+                job.cancel.set()
+            return job.status()
+
+    def _job(self, sequence_id: str) -> SequenceJob:
+        job = self._jobs.get(sequence_id)
+        if job is None:
+            raise HTTPException(404, f"Sequence {sequence_id} not found")
+        return job
+
+    def _finish(self, job: SequenceJob, state: SequenceState, error: str | None = None) -> None:
+        job.state = state
+        job.error = error
+        job.finished_at = time.time()
+        finished = [j.id for j in self._jobs.values() if j.finished_at is not None]
+        for sequence_id in finished[:max(len(finished) - MAX_FINISHED, 0)]:
+            del self._jobs[sequence_id]
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._stop:
+                    self._condition.wait()
+                if self._stop:
+                    return
+                job = self._queue.popleft()
+                job.state = "running"
+                job.started_at = time.time()
+            state, error = self._execute(job)
+            with self._condition:
+                self._finish(job, state, error)
+
+    def _execute(self, job: SequenceJob) -> tuple[SequenceState, str | None]:
+        ls = LakeshoreService()
+        for index, step in enumerate(job.sequence.steps):
+            if job.cancel.is_set():
+                return "cancelled", None
+            job.current_step = index
+            started_at = time.time()
+            try:
+                result = self._run_step(ls, job, step)
+            except SequenceCancelled:
+                return "cancelled", None
+            except Exception as e:
+                if isinstance(e, HTTPException):
+                    error = str(e.detail)
+                elif isinstance(e, LakeshoreError):
+                    error = e.message
+                else:
+                    error = str(e)
+                job.results.append(StepResult(index=index, kind=step.kind, is_success=False, error=error,
+                                              started_at=started_at, finished_at=time.time()))
+                return "failed", f"Step {index} ({step.kind}) failed: {error}"
+            job.results.append(StepResult(index=index, kind=step.kind, is_success=True, result=result,
+                                          started_at=started_at, finished_at=time.time()))
+        job.current_step = len(job.sequence.steps)
+        return "completed", None
+
+    def _request(self, job: SequenceJob) -> Request:
+        # Service methods take the app's lock and state from the request; give each step a
+        # request of its own so it gets a fresh endpoint-default deadline.
+        return Request({"type": "http", "app": self.app, "headers": job.headers, "client": job.client, "state": {}})
+
+    def _run_step(self, ls: LakeshoreService, job: SequenceJob, step: SequenceStep) -> Any:
+        match step:
+            case OperationStep():
+                return run_operation(ls, self._request(job), step)
+            case SampleStep():
+                return jsonable_encoder(
+                    ls.get_monitor_burst(self._request(job), list(dict.fromkeys(step.channels)), step.n, step.units),
+                    by_alias=True, exclude_unset=True)
+            case WaitStableStep():
+                return self._wait_stable(ls, job, step)
+            case DelayStep():
+                if job.cancel.wait(step.seconds):
+                    raise SequenceCancelled()
+                return None
+
+    def _wait_stable(self, ls: LakeshoreService, job: SequenceJob, step: WaitStableStep) -> dict:
+        window = RollingWindow(step.window)
+        start = time.monotonic()
+        while True:
+            t = time.monotonic()
+            window.add(t, ls.get_monitor(self._request(job), step.channel, {"kelvin"}).kelvin)
+            # The window holds the readings of the last step.window seconds; require it to be full
+            settled = (t - start >= step.window
+                       and max(window.max - window.mean, window.mean - window.min) <= step.tolerance)
+            if settled:
+                return {"mean": window.mean, "stddev": window.stddev, "elapsed": t - start}
+            if t - start >= step.timeout:
+                raise TimeoutError(f"Channel {step.channel} did not settle within {step.timeout} s")
+            if job.cancel.wait(step.poll_interval):
+                raise SequenceCancelled()
@@ -0,0 +1,199 @@
+import math
+from collections import deque
+from threading import Lock
+
+from schemas.reading import ChannelStats, StatsConfig, StabilityEvent
+from services.events import EventHub
+from services.sampler import CHANNELS, Sample
+
+
+class RollingWindow:
+    """
+    Mean, variance, min, max and least-squares slope over a sliding time window.
+
+    Every statistic is updated incrementally as samples enter and leave the window
+    (Welford for mean/variance, monotonic deques for min/max, running sums for the
+    slope), so each sample costs amortized O(1) regardless of the window length. Slope
+    sums use times relative to an origin that is moved up to the oldest sample once the
+    window has turned over, so they stay small however long the window runs.
+    """
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        self._samples: deque[tuple[float, float]] = deque()
+        self._min: deque[tuple[float, float]] = deque()
+        self._max: deque[tuple[float, float]] = deque()
+        self._origin: float | None = None
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._st = self._sy = self._stt = self._sty = 0.0
+
+    def add(self, t: float, y: float) -> None:
+        while self._samples and t - self._samples[0][0] > self.window:
+            self._remove(*self._samples.popleft())
+        if self._origin is None:
+            self._origin = t
+        elif self._samples and self._samples[0][0] - self._origin > self.window:
+            self._rebase()
+        self._samples.append((t, y))
+
+        self.n += 1
+        delta = y - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (y - self.mean)
+
+        x = t - self._origin
+        self._st += x
+        self._sy += y
+        self._stt += x * x
+        self._sty += x * y
+
+        while self._min and self._min[-1][1] >= y:
+            self._min.pop()
+        self._min.append((t, y))
+        while self._max and self._max[-1][1] <= y:
+            self._max.pop()
+        self._max.append((t, y))
+
+    def _remove(self, t: float, y: float) -> None:
+        self.n -= 1
+        if self.n == 0:
+            self.mean = self._m2 = 0.0
+            self._st = self._sy = self._stt = self._sty = 0.0
+            self._origin = None
+        else:
+            delta = y - self.mean
+            self.mean -= delta / self.n
+            self._m2 = max(self._m2 - delta * (y - self.mean), 0.0)
+            x = t - self._origin
+            self._st -= x
+            self._sy -= y
+            self._stt -= x * x
+            self._sty -= x * y
+        if self._min and self._min[0][0] == t:
+            self._min.popleft()
+        if self._max and self._max[0][0] == t:
+            self._max.popleft()
+
+    def _rebase(self) -> None:
+        # Shifting the origin by d leaves mean and variance alone and moves the slope sums in O(1)
+        origin = self._samples[0][0]
+        d = origin - self._origin
+        self._stt += -2 * d * self._st + self.n * d * d
+        self._st -= self.n * d
+        self._sty -= d * self._sy
+        self._origin = origin
+
+    @property
+    def span(self) -> float:
+        return self._samples[-1][0] - self._samples[0][0] if self._samples else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self._m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+    @property
+    def min(self) -> float | None:
+        return self._min[0][1] if self._min else None
+
+    @property
+    def max(self) -> float | None:
+        return self._max[0][1] if self._max else None
+
+    @property
+    def slope(self) -> float | None:
+        denominator = self.n * self._stt - self._st * self._st
+        if self.n < 2 or denominator <= 0:
+            return None
+        return (self.n * self._sty - self._st * self._sy) / denominator
+
+
+class StatisticsEngine:
+    """
+    Per-channel rolling kelvin statistics fed by the reading sampler.
+
+    Publishes a ``stability`` event whenever a channel enters or leaves its
+    configured stability band.
+    """
+
+    def __init__(self, hub: EventHub, config: StatsConfig | None = None) -> None:
+        self.hub = hub
+        self._lock = Lock()
+        self._config = {ch: config or StatsConfig() for ch in range(1, CHANNELS + 1)}
+        self._windows = {ch: RollingWindow(self._config[ch].window) for ch in self._config}
+        self._stable_since: dict[int, float | None] = dict.fromkeys(self._config)
+
+    def get_config(self, channel: int) -> StatsConfig:
+        with self._lock:
+            return self._config[channel]
+
+    def set_config(self, channel: int, config: StatsConfig) -> None:
+        """
+        Replace a channel's window and stability criteria. Resets its statistics.
+
+        :param self: StatisticsEngine instance
+        :param channel: Channel number
+        :type channel: int
+        :param config: New configuration
+        :type config: StatsConfig
+        """
+        with self._lock:
+            self._config[channel] = config
+            self._windows[channel] = RollingWindow(config.window)
+            self._stable_since[channel] = None
+
+    def get_stats(self, channel: int) -> ChannelStats:
+        with self._lock:
+            return self._stats(channel)
+
+    def _stats(self, channel: int) -> ChannelStats:
+        window = self._windows[channel]
+        return ChannelStats(
+            channel=channel,
+            window=window.window,
+            count=window.n,
+            span=window.span,
+            mean=window.mean if window.n else None,
+            stddev=window.stddev if window.n else None,
+            min=window.min,
+            max=window.max,
+            slope=window.slope,
+            stable=self._stable_since[channel] is not None,
+            stable_since=self._stable_since[channel],
+        )
+
+    def _is_stable(self, channel: int) -> bool:
+        config = self._config[channel]
+        window = self._windows[channel]
+        # Require the window to be (nearly) filled before declaring stability
+        if window.n < 2 or window.span < 0.9 * config.window:
+            return False
+        if max(window.max - window.mean, window.mean - window.min) > config.tolerance:
+            return False
+        slope = window.slope
+        return config.max_slope is None or slope is None or abs(slope) <= config.max_slope
+
+    def update(self, sample: Sample) -> None:
+        """
+        Feed the channels refreshed by a sampler pass into their windows.
+
+        :param self: StatisticsEngine instance
+        :param sample: Latest sample of every channel
+        :type sample: Sample
+        """
+        events = []
+        with self._lock:
+            for i in sample.updated.nonzero()[0]:
+                channel = int(i) + 1
+                t, kelvin = float(sample.timestamps[i]), float(sample.kelvin[i])
+                if math.isnan(kelvin):
+                    continue
+                self._windows[channel].add(t, kelvin)
+                stable = self._is_stable(channel)
+                if stable != (self._stable_since[channel] is not None):
+                    self._stable_since[channel] = t if stable else None
+                    events.append(StabilityEvent(
+                        stats=self._stats(channel), timestamp=t))
+        for event in events:
+            self.hub.publish("stability", event.model_dump_json(by_alias=True))
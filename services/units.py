@@ -0,0 +1,78 @@
+import json
+from collections.abc import Callable, Iterable
+
+import numpy as np
+
+from schemas.reading import TemperatureUnit
+
+# Response field holding each unit
+UNIT_FIELDS: dict[TemperatureUnit, str] = {"K": "kelvin", "C": "celsius", "F": "fahrenheit", "S": "sensor"}
+
+# Units returned when a client does not ask for any
+DEFAULT_UNITS: tuple[TemperatureUnit, ...] = ("K", "S")
+
+# Units computed from the kelvin reading rather than read from the device
+TEMPERATURE_UNITS = frozenset(("K", "C", "F"))
+
+type Values = float | np.ndarray
+
+
+def from_kelvin(kelvin: Values, unit: TemperatureUnit) -> Values:
+    """
+    Convert kelvin readings (a scalar or an array of any shape) to another temperature unit.
+
+    :param kelvin: Kelvin readings
+    :type kelvin: float | np.ndarray
+    :param unit: Target unit, K, C or F
+    :type unit: TemperatureUnit
+    :return: Converted readings
+    :rtype: float | np.ndarray
+    """
+    if unit == "C":
+        return kelvin - 273.15
+    if unit == "F":
+        return kelvin * 1.8 - 459.67
+    return kelvin
+
+
+def convert(kelvin: Values | None, sensor: Values | None,
+            units: Iterable[TemperatureUnit]) -> dict[str, Values | None]:
+    """
+    Express one reading (or a whole array of readings) in each requested unit.
+
+    Every temperature unit is derived from the single kelvin reading, so extra units cost
+    no device queries; ``S`` passes the raw sensor reading through.
+
+    :param kelvin: Kelvin readings, None if not read
+    :type kelvin: float | np.ndarray | None
+    :param sensor: Raw sensor readings, None if not read
+    :type sensor: float | np.ndarray | None
+    :param units: Requested units
+    :type units: Iterable[TemperatureUnit]
+    :return: Readings keyed by the response field of each unit
+    :rtype: dict[str, float | np.ndarray | None]
+    """
+    return {UNIT_FIELDS[unit]: sensor if unit == "S" else None if kelvin is None else from_kelvin(kelvin, unit)
+            for unit in units}
+
+
+def needs_kelvin(units: Iterable[TemperatureUnit]) -> bool:
+    return any(unit in TEMPERATURE_UNITS for unit in units)
+
+
+def reading_units(units: list[TemperatureUnit]) -> Callable[[str, str], str]:
+    """
+    Build an event stream transform expressing ``reading`` events in the given units.
+
+    :param units: Units to include in each reading event
+    :type units: list[TemperatureUnit]
+    :return: Transform taking (topic, data) and returning the new data
+    :rtype: Callable[[str, str], str]
+    """
+    def transform(topic: str, data: str) -> str:
+        if topic != "reading":
+            return data
+        event = json.loads(data)
+        event.update(convert(event.pop("kelvin", None), event.pop("sensor", None), units))
+        return json.dumps(event)
+    return transform